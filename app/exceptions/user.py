@@ -1,9 +1,29 @@
-class UserNotFoundException(Exception):
-    def __init__(self, message="User not found"):
-        self.message = message
+class UserException(Exception):
+    """
+    Base exception for user-related errors that carry a default message.
+
+    Subclasses only override ``DEFAULT_MESSAGE``; a message passed at raise
+    time takes precedence over it.
+
+    Attributes:
+        message (str): Explanation of the error.
+    """
+
+    __slots__ = ("message",)
+
+    DEFAULT_MESSAGE = "User error"
+
+    def __init__(self, message=None):
+        self.message = self.DEFAULT_MESSAGE if message is None else message
         super().__init__(self.message)
 
 
+class UserNotFoundException(UserException):
+    __slots__ = ()
+
+    DEFAULT_MESSAGE = "User not found"
+
+
 class DuplicateUserError(Exception):
     """
     Exception raised when attempting to create a user that already exists.
@@ -17,25 +37,25 @@ class DuplicateUserError(Exception):
     """
 
 
-class InternalServerErrorException(Exception):
-    def __init__(self, message="Internal server error"):
-        self.message = message
-        super().__init__(self.message)
+class InternalServerErrorException(UserException):
+    __slots__ = ()
 
+    DEFAULT_MESSAGE = "Internal server error"
 
-class UnauthorizedException(Exception):
-    def __init__(self, message="Unauthorized access"):
-        self.message = message
-        super().__init__(self.message)
 
+class UnauthorizedException(UserException):
+    __slots__ = ()
 
-class InvalidSortFieldException(Exception):
-    def __init__(self, message="Invalid sort field"):
-        self.message = message
-        super().__init__(self.message)
+    DEFAULT_MESSAGE = "Unauthorized access"
 
 
-class InvalidSortTypeException(Exception):
-    def __init__(self, message="Invalid sort type"):
-        self.message = message
-        super().__init__(self.message)
+class InvalidSortFieldException(UserException):
+    __slots__ = ()
+
+    DEFAULT_MESSAGE = "Invalid sort field"
+
+
+class InvalidSortTypeException(UserException):
+    __slots__ = ()
+
+    DEFAULT_MESSAGE = "Invalid sort type"
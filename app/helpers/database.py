@@ -95,5 +95,9 @@ def db() -> Session:
     return session_factory()
 
 
-# For backward compatibility
-engine = get_engine()
+def __getattr__(name: str):
+    # For backward compatibility: ``engine`` used to be created at import
+    # time; build it on first access instead so cold starts skip it
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
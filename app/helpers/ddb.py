@@ -2,7 +2,6 @@ from functools import lru_cache
 
 import boto3
 from botocore.config import Config
-from botocore.exceptions import ClientError
 
 from app.helpers.environment import env
 from app.helpers.logger import get_logger
@@ -55,16 +54,17 @@ def get_dynamodb_clients():
         client = boto3.client("dynamodb", **kwargs)
         table = resource.Table(settings.DDB_TABLE_NAME)
 
-        # Test connection
-        try:
-            response = client.describe_table(TableName=settings.DDB_TABLE_NAME)
-            logger.info(
-                f"DynamoDB connected - Status: {response['Table']['TableStatus']}"
-            )
-        except ClientError as e:
-            if e.response["Error"]["Code"] != "ResourceNotFoundException":
-                raise
-            logger.warning(f"Table '{settings.DDB_TABLE_NAME}' not found")
+        # Test connection only when asked to; otherwise a missing table
+        # surfaces on the first real operation instead of costing every cold
+        # start a round trip
+        if getattr(settings, "DDB_VERIFY_CONNECTION", False):
+            try:
+                response = client.describe_table(TableName=settings.DDB_TABLE_NAME)
+                logger.info(
+                    f"DynamoDB connected - Status: {response['Table']['TableStatus']}"
+                )
+            except client.exceptions.ResourceNotFoundException:
+                logger.warning(f"Table '{settings.DDB_TABLE_NAME}' not found")
 
         logger.info(f"Initialized {env_type} DynamoDB clients")
         return resource, client, table
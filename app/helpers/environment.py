@@ -76,6 +76,7 @@ class EnvironmentVariables(BaseSettings):
     DDB_READ_TIMEOUT: Optional[int] = 60
     DDB_CONNECT_TIMEOUT: Optional[int] = 10
     DDB_REGION: Optional[str] = "ap-southeast-1"
+    DDB_VERIFY_CONNECTION: bool = False
 
     STORAGE_TYPE: str = "local"
     STORAGE_BUCKET: Optional[str] = None
@@ -83,16 +84,6 @@ class EnvironmentVariables(BaseSettings):
 
     model_config = ConfigDict(env_file=".env", env_file_encoding="utf-8")
 
-    @field_validator("APP_ENVIRONMENT")
-    def validate_app_environment(cls, v):
-        """Validate APP_ENVIRONMENT is one of the expected values."""
-        valid_environments = ["local", "dev", "uat", "prod", "test"]
-        if v not in valid_environments:
-            raise ValueError(
-                f"APP_ENVIRONMENT must be one of {valid_environments}, got '{v}'"
-            )
-        return v
-
     @field_validator("DB_PORT", mode="before")
     def default_db_port(cls, v):
         if v is None or v == "":
@@ -116,9 +107,10 @@ class EnvironmentVariables(BaseSettings):
         if v is None:
             return None
         if isinstance(v, str):
-            if v.lower() in ("false", "0", "no"):
+            v = v.lower()
+            if v in ("false", "0", "no"):
                 return False
-            elif v.lower() in ("true", "1", "yes"):
+            elif v in ("true", "1", "yes"):
                 return True
             else:
                 return None
@@ -148,7 +140,8 @@ def env(var_name: Optional[str] = None, default: Optional[str] = None) -> Option
         EnvironmentVariables class or the value of the specified
         environment variable, or the default value if not found.
     """
-    env_vars = EnvironmentVariables()
     if var_name:
-        return getattr(env_vars, var_name, default)
-    return env_vars
+        # Reuse the cached settings instead of re-reading the environment
+        # and .env file for every distinct variable lookup
+        return getattr(env(), var_name, default)
+    return EnvironmentVariables()
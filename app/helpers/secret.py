@@ -1,21 +1,178 @@
+import heapq
 import json
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable
 
 import boto3
 
 
+# Loaded secrets are reused across Secret instances for this many seconds
+SECRET_CACHE_TTL_SECONDS = 300.0
+
+# Upper bound on cached secrets; the least recently used entry is evicted
+SECRET_CACHE_MAX_SIZE = 128
+
+# Most secrets BatchGetSecretValue accepts in one SecretIdList
+BATCH_GET_SECRET_SIZE = 20
+
+
+@lru_cache(maxsize=1)
+def get_secrets_manager_client():
+    """Get a cached Secrets Manager client shared by all Secret instances."""
+    return boto3.client("secretsmanager")
+
+
 class Secret:
+    # secret_id -> (monotonic expiry, parsed secret payload)
+    _cache: "OrderedDict[str, tuple]" = OrderedDict()
+    # (monotonic expiry, secret_id) for every store, so expired entries can be
+    # found without scanning the cache; superseded entries are skipped
+    _expiry_heap: list = []
+    _cache_lock = threading.Lock()
+
     def __init__(self, secret_id: str = None):
         self._data = {}
         if secret_id:
             self.load(secret_id)
 
+    @classmethod
+    def clear_cache(cls):
+        """Drop every cached secret so the next load fetches it again."""
+        with cls._cache_lock:
+            cls._cache.clear()
+            cls._expiry_heap.clear()
+
+    @classmethod
+    def invalidate(cls, secret_id: str):
+        """Forget one cached secret, e.g. after it has been rotated."""
+        with cls._cache_lock:
+            # Its heap entry is skipped by the sweep once the key is gone
+            cls._cache.pop(secret_id, None)
+
+    @classmethod
+    def purge_expired(cls) -> int:
+        """Drop every expired secret now and return how many were removed.
+
+        Long-running processes can call this periodically; otherwise
+        expired entries are swept when a secret is stored.
+        """
+        with cls._cache_lock:
+            return cls._sweep_expired(time.monotonic())
+
+    @classmethod
+    def _get_cached(cls, secret_id: str):
+        with cls._cache_lock:
+            entry = cls._cache.get(secret_id)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del cls._cache[secret_id]
+                return None
+            cls._cache.move_to_end(secret_id)
+            return entry[1]
+
+    @classmethod
+    def _sweep_expired(cls, now: float) -> int:
+        """Drop expired entries; the caller must hold ``_cache_lock``."""
+        heap = cls._expiry_heap
+        cache = cls._cache
+        removed = 0
+        while heap and heap[0][0] <= now:
+            expiry, secret_id = heapq.heappop(heap)
+            entry = cache.get(secret_id)
+            # Entries stored again since this push carry a later expiry
+            if entry is not None and entry[0] == expiry:
+                del cache[secret_id]
+                removed += 1
+        return removed
+
+    @classmethod
+    def _store(cls, secret_id: str, data: dict):
+        with cls._cache_lock:
+            now = time.monotonic()
+            expiry = now + SECRET_CACHE_TTL_SECONDS
+            cls._cache[secret_id] = (expiry, data)
+            cls._cache.move_to_end(secret_id)
+            heapq.heappush(cls._expiry_heap, (expiry, secret_id))
+            # Expired entries go first so they never push out live ones
+            cls._sweep_expired(now)
+            while len(cls._cache) > SECRET_CACHE_MAX_SIZE:
+                cls._cache.popitem(last=False)
+
     def load(self, secret_id: str):
+        cached = self._get_cached(secret_id)
+        if cached is not None:
+            self._data = cached
+            return
+
+        # The lock is not held across the network call so concurrent loads
+        # of different secrets do not wait on each other
         try:
-            client = boto3.client("secretsmanager")
+            client = get_secrets_manager_client()
             response = client.get_secret_value(SecretId=secret_id)
             self._data = json.loads(response["SecretString"])
         except Exception:
             self._data = {}
+            return
+
+        self._store(secret_id, self._data)
+
+    @classmethod
+    def load_many(cls, secret_ids: Iterable[str]) -> Dict[str, "Secret"]:
+        """Load several secrets, fetching cache misses in batched calls.
+
+        Secrets the batch call cannot resolve (including partial ARNs that
+        do not match the returned name or ARN) fall back to ``load``.
+        """
+        secrets = {}
+        misses = []
+        for secret_id in dict.fromkeys(secret_ids):
+            secret = cls()
+            cached = cls._get_cached(secret_id)
+            if cached is not None:
+                secret._data = cached
+            else:
+                misses.append(secret_id)
+            secrets[secret_id] = secret
+
+        fetched = cls._batch_fetch(misses) if misses else {}
+        for secret_id in misses:
+            data = fetched.get(secret_id)
+            if data is None:
+                secrets[secret_id].load(secret_id)
+            else:
+                secrets[secret_id]._data = data
+                cls._store(secret_id, data)
+
+        return secrets
+
+    @staticmethod
+    def _batch_fetch(secret_ids) -> Dict[str, dict]:
+        """Fetch and parse secrets via BatchGetSecretValue, keyed by request."""
+        fetched = {}
+        try:
+            client = get_secrets_manager_client()
+            for start in range(0, len(secret_ids), BATCH_GET_SECRET_SIZE):
+                chunk = secret_ids[start : start + BATCH_GET_SECRET_SIZE]
+                requested = set(chunk)
+                response = client.batch_get_secret_value(SecretIdList=chunk)
+                for value in response.get("SecretValues", []):
+                    secret_id = next(
+                        (
+                            key
+                            for key in (value.get("ARN"), value.get("Name"))
+                            if key in requested
+                        ),
+                        None,
+                    )
+                    if secret_id is not None:
+                        fetched[secret_id] = json.loads(value["SecretString"])
+        except Exception:
+            pass
+        return fetched
 
     def __call__(self, key: str, default=None):
         return self._data.get(key, default)
@@ -0,0 +1,36 @@
+import json
+
+
+try:
+    import orjson
+
+    # Datetimes go through ``default`` so output matches the json module
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_dumps(data, default=None) -> str:
+    """
+    Serialize data to a compact JSON string, using orjson when it is installed.
+
+    The json module fallback uses the same separators and keeps non-ASCII
+    text unescaped, so the output does not depend on which one is used.
+
+    Args:
+        data: The value to serialize.
+        default: Callable used for objects that are not JSON serializable.
+
+    Returns:
+        str: The JSON document.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, default=default, option=_ORJSON_OPTIONS).decode(
+                "utf-8"
+            )
+        except TypeError:
+            # orjson is stricter (e.g. integers over 64 bits); let json decide
+            pass
+    return json.dumps(data, default=default, separators=(",", ":"), ensure_ascii=False)
@@ -4,8 +4,19 @@ from app.helpers.environment import env
 from app.helpers.logger import get_logger
 
 
+def _data_size(data) -> int:
+    """Return the UTF-8 byte size of ``str(data)`` without copying ASCII."""
+    text = str(data)
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-8"))
+
+
 def standard_logger(handler, logger=None):
     logger = logger or get_logger("spartan-framework")
+    # Settings are fixed for the life of the process, so decide once whether
+    # payloads are echoed instead of on every invocation
+    debug_echo = env("APP_ENVIRONMENT") == "local" and env("APP_DEBUG")
 
     def wrapped_handler(event, context):
         lambda_function = {
@@ -16,7 +27,7 @@ def standard_logger(handler, logger=None):
             "aws_request_id": context.aws_request_id,
         }
         try:
-            input_data_size = len(str(event).encode("utf-8"))
+            input_data_size = _data_size(event)
             logger.info(
                 "Input Data",
                 extra={
@@ -26,7 +37,7 @@ def standard_logger(handler, logger=None):
                 },
             )
 
-            if env("APP_ENVIRONMENT") == "local" and env("APP_DEBUG"):
+            if debug_echo:
                 print(
                     json.dumps(
                         {
@@ -40,7 +51,7 @@ def standard_logger(handler, logger=None):
 
             response = handler(event, context)
 
-            output_data_size = len(str(response).encode("utf-8"))
+            output_data_size = _data_size(response)
             logger.info(
                 "Output Data",
                 extra={
@@ -50,7 +61,7 @@ def standard_logger(handler, logger=None):
                 },
             )
 
-            if env("APP_ENVIRONMENT") == "local" and env("APP_DEBUG"):
+            if debug_echo:
                 print(
                     json.dumps(
                         {
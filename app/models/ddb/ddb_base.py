@@ -1,10 +1,46 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from pydantic import BaseModel, ConfigDict
 
 
+def _number_attribute(value) -> Dict[str, Any]:
+    return {"N": str(value)}
+
+
+def _string_attribute(value) -> Dict[str, Any]:
+    return {"S": str(value)}
+
+
+# DynamoDB attribute builder per dumped Python type, checked in this order
+# when a value's exact type is not a key (e.g. enum subclasses)
+_DDB_ATTRIBUTE_BUILDERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    str: lambda value: {"S": value},
+    bool: lambda value: {"BOOL": value},
+    int: _number_attribute,
+    float: _number_attribute,
+    datetime: lambda value: {"S": value.isoformat()},
+    list: lambda value: {"L": [{"S": str(v)} for v in value]},
+    dict: lambda value: {"M": {k: {"S": str(v)} for k, v in value.items()}},
+}
+
+
+def _to_ddb_attribute(value) -> Dict[str, Any]:
+    """Convert a dumped field value to a DynamoDB attribute value."""
+    builder = _DDB_ATTRIBUTE_BUILDERS.get(type(value))
+    if builder is None:
+        builder = next(
+            (
+                candidate
+                for value_type, candidate in _DDB_ATTRIBUTE_BUILDERS.items()
+                if isinstance(value, value_type)
+            ),
+            _string_attribute,
+        )
+    return builder(value)
+
+
 class DDBModel(BaseModel, ABC):
     """
     Base class for DynamoDB models.
@@ -45,20 +81,7 @@ class DDBModel(BaseModel, ABC):
 
         for key, value in model_dict.items():
             if value is not None:
-                if isinstance(value, str):
-                    item[key] = {"S": value}
-                elif isinstance(value, bool):
-                    item[key] = {"BOOL": value}
-                elif isinstance(value, (int, float)):
-                    item[key] = {"N": str(value)}
-                elif isinstance(value, datetime):
-                    item[key] = {"S": value.isoformat()}
-                elif isinstance(value, list):
-                    item[key] = {"L": [{"S": str(v)} for v in value]}
-                elif isinstance(value, dict):
-                    item[key] = {"M": {k: {"S": str(v)} for k, v in value.items()}}
-                else:
-                    item[key] = {"S": str(value)}
+                item[key] = _to_ddb_attribute(value)
 
         return item
 
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from functools import cached_property
+from typing import Any, Dict, Iterator, List, Optional, Type, TypeVar
 
 from app.helpers.ddb import dynamodb_client, table_name
 from app.helpers.logger import get_logger
@@ -11,6 +13,13 @@ T = TypeVar("T")
 
 logger = get_logger(__name__)
 
+# Sort key of the item holding an entity's attributes
+METADATA_SK = "METADATA"
+
+# batch_get_item accepts at most 100 keys per request
+BATCH_GET_SIZE = 100
+BATCH_GET_MAX_WORKERS = 8
+
 
 class BaseRepository(ABC):
     """
@@ -27,6 +36,19 @@ class BaseRepository(ABC):
         self.dynamodb = dynamodb_client
         self.table_name = table_name
 
+    @cached_property
+    def _pk_prefix(self) -> str:
+        # Built on first use, so get_entity_type() may rely on attributes a
+        # subclass sets after calling super().__init__()
+        return f"{self.get_entity_type()}#"
+
+    def _key(self, entity_id: str) -> Dict[str, Dict[str, str]]:
+        """Build the PK/SK key of an entity's metadata item."""
+        return {
+            "PK": {"S": f"{self._pk_prefix}{entity_id}"},
+            "SK": {"S": METADATA_SK},
+        }
+
     @abstractmethod
     def get_model_class(self) -> Type[T]:
         """Return the model class this repository handles."""
@@ -45,39 +67,14 @@ class BaseRepository(ABC):
         Returns:
             Model instance or None if not found
         """
-        if not entity_id or "../" in entity_id or "\\" in entity_id:
-            raise ValueError("Invalid entity ID")
-
-        try:
-            pk = f"{self.get_entity_type()}#{entity_id}"
-            sk = "METADATA"
-
-            response = self.dynamodb.get_item(
-                TableName=self.table_name,
-                Key={
-                    "PK": {"S": pk},
-                    "SK": {"S": sk},
-                },
-            )
-
-            if "Item" not in response:
-                return None
-
-            model_class = self.get_model_class()
-            entity = model_class.from_ddb_item(response["Item"])
-
-            # Check if entity is soft deleted
-            if hasattr(entity, "deleted_at") and entity.deleted_at:
-                return None
-
-            return entity
+        entity = self.get_by_id_including_deleted(entity_id)
 
-        except Exception as e:
-            logger.error(
-                f"Failed to get {self.get_entity_type().lower()} {entity_id}: {e}"
-            )
+        # Check if entity is soft deleted
+        if getattr(entity, "deleted_at", None):
             return None
 
+        return entity
+
     def save(self, entity: T) -> bool:
         """
         Save an entity to DynamoDB.
@@ -110,15 +107,8 @@ class BaseRepository(ABC):
             True if successful, False otherwise
         """
         try:
-            pk = f"{self.get_entity_type()}#{entity_id}"
-            sk = "METADATA"
-
             self.dynamodb.delete_item(
-                TableName=self.table_name,
-                Key={
-                    "PK": {"S": pk},
-                    "SK": {"S": sk},
-                },
+                TableName=self.table_name, Key=self._key(entity_id)
             )
             return True
 
@@ -145,8 +135,9 @@ class BaseRepository(ABC):
 
         # Set deleted_at timestamp
         if hasattr(entity, "deleted_at"):
-            entity.deleted_at = datetime.utcnow()
-            entity.updated_at = datetime.utcnow()
+            now = datetime.utcnow()
+            entity.deleted_at = now
+            entity.updated_at = now
             return self.save(entity)
 
         return False
@@ -165,15 +156,8 @@ class BaseRepository(ABC):
             raise ValueError("Invalid entity ID")
 
         try:
-            pk = f"{self.get_entity_type()}#{entity_id}"
-            sk = "METADATA"
-
             response = self.dynamodb.get_item(
-                TableName=self.table_name,
-                Key={
-                    "PK": {"S": pk},
-                    "SK": {"S": sk},
-                },
+                TableName=self.table_name, Key=self._key(entity_id)
             )
 
             if "Item" not in response:
@@ -213,6 +197,49 @@ class BaseRepository(ABC):
             logger.error(f"Failed to list {self.get_entity_type().lower()}s: {e}")
             return {"items": [], "last_evaluated_key": None, "count": 0}
 
+    def iter_by_entity_type(
+        self,
+        page_size: int = 20,
+        search: Optional[str] = None,
+        sort_order: str = "desc",
+        include_deleted: bool = False,
+    ) -> Iterator[T]:
+        """
+        Iterate over all entities of this type, following pagination.
+
+        Pages are fetched lazily, so only one page of items is held in
+        memory at a time.
+
+        Args:
+            page_size: Number of entities requested per query
+            search: Optional name filter
+            sort_order: "asc" or "desc"
+            include_deleted: Whether soft deleted entities are included
+
+        Yields:
+            Model instances
+        """
+        model_class = self.get_model_class()
+        last_evaluated_key = None
+
+        while True:
+            query_params = self._build_query_params(
+                page_size, sort_order, include_deleted, last_evaluated_key, search
+            )
+            response = self.dynamodb.query(**query_params)
+
+            for item in response.get("Items", []):
+                try:
+                    entity = model_class.from_ddb_item(item)
+                except Exception as e:
+                    logger.warning(f"Skipping invalid record: {e}")
+                    continue
+                yield entity
+
+            last_evaluated_key = response.get("LastEvaluatedKey")
+            if not last_evaluated_key:
+                return
+
     def _build_query_params(
         self, limit, sort_order, include_deleted, last_evaluated_key, search
     ):
@@ -290,36 +317,40 @@ class BaseRepository(ABC):
             return []
 
         try:
-            # Build batch get request
-            keys = []
-            for entity_id in entity_ids:
-                pk = f"{self.get_entity_type()}#{entity_id}"
-                sk = "METADATA"
-                keys.append(
-                    {
-                        "PK": {"S": pk},
-                        "SK": {"S": sk},
-                    }
-                )
+            # Build batch get request; every key shares the same SK value,
+            # which the client only reads, so one dict serves them all
+            prefix = self._pk_prefix
+            sk = {"S": METADATA_SK}
+            keys = [
+                {"PK": {"S": f"{prefix}{entity_id}"}, "SK": sk}
+                for entity_id in entity_ids
+            ]
 
             # DynamoDB batch_get_item has a limit of 100 items
-            batch_size = 100
+            batches = [
+                keys[i : i + BATCH_GET_SIZE]
+                for i in range(0, len(keys), BATCH_GET_SIZE)
+            ]
             all_entities = []
+            model_class = self.get_model_class()
 
-            for i in range(0, len(keys), batch_size):
-                batch_keys = keys[i : i + batch_size]
-
-                response = self.dynamodb.batch_get_item(
-                    RequestItems={self.table_name: {"Keys": batch_keys}}
-                )
-
+            # Requests are I/O bound and the client is thread safe, so
+            # several batches are fetched at once; results keep input order
+            if len(batches) == 1:
+                responses = [self._batch_get_items(batches[0])]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(len(batches), BATCH_GET_MAX_WORKERS)
+                ) as executor:
+                    responses = list(executor.map(self._batch_get_items, batches))
+
+            for items in responses:
                 # Convert items to models
-                model_class = self.get_model_class()
-                for item in response.get("Responses", {}).get(self.table_name, []):
+                for item in items:
                     try:
                         entity = model_class.from_ddb_item(item)
                         # Skip soft deleted items
-                        if hasattr(entity, "deleted_at") and entity.deleted_at:
+                        if getattr(entity, "deleted_at", None):
                             continue
                         all_entities.append(entity)
                     except Exception as e:
@@ -335,6 +366,13 @@ class BaseRepository(ABC):
             logger.error(f"Failed to batch get {self.get_entity_type().lower()}s: {e}")
             return []
 
+    def _batch_get_items(self, keys: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fetch one batch_get_item page and return its raw items."""
+        response = self.dynamodb.batch_get_item(
+            RequestItems={self.table_name: {"Keys": keys}}
+        )
+        return response.get("Responses", {}).get(self.table_name, [])
+
     def exists(self, entity_id: str) -> bool:
         """
         Check if an entity exists by ID.
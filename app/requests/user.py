@@ -1,7 +1,37 @@
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, StringConstraints, field_validator
+
+# Stripped by pydantic-core; passwords are deliberately left untouched
+Username = Annotated[str, StringConstraints(strip_whitespace=True)]
+
+
+def _check_username(value, max_length):
+    """Username checks shared by the user request models."""
+    if not isinstance(value, str):
+        return value
+
+    # Length is checked on the value that will be stored
+    length = len(value.strip())
+    if not length:
+        raise ValueError("The name field is required")
+
+    if length < 3:
+        raise ValueError("Name must be at least 3 characters long")
+
+    if length > max_length:
+        raise ValueError(f"Name must be at most {max_length} characters long")
+
+    return value
+
+
+def _check_email(value):
+    """Email checks shared by the user request models."""
+    if isinstance(value, str) and (not value or value.isspace()):
+        raise ValueError("The email field is required")
+
+    return value
 
 
 class UserCreateRequest(BaseModel):
@@ -14,7 +44,7 @@ class UserCreateRequest(BaseModel):
         password (str): The password for the new user.
     """
 
-    username: str
+    username: Username
     email: EmailStr
     password: str
     created_at: datetime = datetime.now()
@@ -23,24 +53,14 @@ class UserCreateRequest(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
     @field_validator("username", mode="before")
+    @classmethod
     def check_name(cls, value):
-        if not value.strip():
-            raise ValueError("The name field is required")
-
-        if len(value) < 3:
-            raise ValueError("Name must be at least 3 characters long")
-
-        if len(value) > 50:
-            raise ValueError("Name must be at most 50 characters long")
-
-        return value
+        return _check_username(value, max_length=50)
 
     @field_validator("email", mode="before")
+    @classmethod
     def check_email(cls, value):
-        if not value.strip():
-            raise ValueError("The email field is required")
-
-        return value
+        return _check_email(value)
 
 
 class UserUpdateRequest(BaseModel):
@@ -53,7 +73,7 @@ class UserUpdateRequest(BaseModel):
         password (Optional[str]): The new password for the user. Optional.
     """
 
-    username: Optional[str] = None
+    username: Optional[Username] = None
     email: Optional[EmailStr] = None
     password: Optional[str] = None
     created_at: datetime = datetime.now()
@@ -61,28 +81,13 @@ class UserUpdateRequest(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+    # None is allowed for the optional fields and skips the checks
     @field_validator("username", mode="before")
+    @classmethod
     def check_name(cls, value):
-        if value is None:
-            return value  # Allow None for optional field
-
-        if not value.strip():
-            raise ValueError("The name field is required")
-
-        if len(value) < 3:
-            raise ValueError("Name must be at least 3 characters long")
-
-        if len(value) > 20:
-            raise ValueError("Name must be at most 20 characters long")
-
-        return value
+        return _check_username(value, max_length=20)
 
     @field_validator("email", mode="before")
+    @classmethod
     def check_email(cls, value):
-        if value is None:
-            return value  # Allow None for optional field
-
-        if not value.strip():
-            raise ValueError("The email field is required")
-
-        return value
+        return _check_email(value)
@@ -3,7 +3,18 @@ from typing import List, Optional
 from pydantic import BaseModel, ConfigDict, field_validator
 
 
-class ProfileResponse(BaseModel):
+class _BaseResponse(BaseModel):
+    """
+    Shared base for response models.
+
+    Schemas are built on first use rather than at import, and responses are
+    immutable once constructed.
+    """
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
+
+class ProfileResponse(_BaseResponse):
     """
     Pydantic model representing a e for a user.
 
@@ -17,7 +28,7 @@ class ProfileResponse(BaseModel):
     family_name: Optional[str] = None
 
 
-class UserResponse(BaseModel):
+class UserResponse(_BaseResponse):
     id: str
     username: str
     email: str
@@ -27,10 +38,26 @@ class UserResponse(BaseModel):
 
     @field_validator("id", mode="before")
     def convert_id_to_string(cls, v):
+        # Any id type (int, UUID, ...) is exposed as its string form
         return str(v)
 
+    @classmethod
+    def from_model(cls, user) -> "UserResponse":
+        """
+        Build a response from a trusted ORM user without running validation.
+
+        Args:
+            user: A persisted user whose fields are already typed by the ORM.
+
+        Returns:
+            UserResponse: The response for the user.
+        """
+        return cls.model_construct(
+            id=str(user.id), username=user.username, email=user.email
+        )
+
 
-class SingleUserResponse(BaseModel):
+class SingleUserResponse(_BaseResponse):
     """
     Pydantic model representing a response for a single User.
 
@@ -43,7 +70,7 @@ class SingleUserResponse(BaseModel):
     status_code: int
 
 
-class Pagination(BaseModel):
+class Pagination(_BaseResponse):
     """
     Pydantic model representing pagination information.
 
@@ -61,7 +88,7 @@ class Pagination(BaseModel):
     total: int
 
 
-class PaginatedUserResponse(BaseModel):
+class PaginatedUserResponse(_BaseResponse):
     """
     Pydantic model representing a paginated response for a list of users.
 
@@ -75,7 +102,7 @@ class PaginatedUserResponse(BaseModel):
     status_code: int
 
 
-class UserCreateResponse(BaseModel):
+class UserCreateResponse(_BaseResponse):
     """
     Pydantic model representing a response for creating a User.
 
@@ -92,7 +119,7 @@ class UserCreateResponse(BaseModel):
     updated_at: str
 
 
-class UserUpdateResponse(BaseModel):
+class UserUpdateResponse(_BaseResponse):
     """
     Pydantic model representing a response for updating a User.
 
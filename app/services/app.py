@@ -11,9 +11,27 @@ class AppService:
     def __init__(self):
         """
         Initializes the AppService class.
-        Sets up the DynamoDB resource and table.
+        The DynamoDB resource and table are set up on first use.
         """
-        self.dynamodb_resource, self.table = self._setup_dynamodb()
+        self._dynamodb_resource = None
+        self._table = None
+
+    def _ensure_dynamodb(self):
+        """Create the DynamoDB resource and table if not done yet."""
+        if self._table is None:
+            self._dynamodb_resource, self._table = self._setup_dynamodb()
+
+    @property
+    def dynamodb_resource(self):
+        """The boto3 DynamoDB resource, created on first access."""
+        self._ensure_dynamodb()
+        return self._dynamodb_resource
+
+    @property
+    def table(self):
+        """The state table, created on first access."""
+        self._ensure_dynamodb()
+        return self._table
 
     @staticmethod
     def _load_config():
@@ -1,7 +1,66 @@
+import os
+import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Optional
+
+
+# Repository root used to report caller locations as relative paths
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+
+# Frames from these paths belong to the logging machinery, not the caller
+LOGGING_FRAME_RE = re.compile(r"/services/logging/|/helpers/logger\.py|/logging/")
+
+# Extra field names whose values are redacted, compared case-insensitively
+SENSITIVE_FIELDS = frozenset(
+    {
+        "password",
+        "token",
+        "secret",
+        "key",
+        "auth",
+        "credentials",
+        "api_key",
+    }
+)
+
+
+@lru_cache(maxsize=1024)
+def is_sensitive_field(key: str) -> bool:
+    """Return whether an extra field must be redacted.
+
+    Applications log the same handful of keys over and over, so the
+    lower-casing and lookup are cached per key.
+    """
+    return key.lower() in SENSITIVE_FIELDS
+
+
+@lru_cache(maxsize=4096)
+def caller_relative_path(filename: str, project_root: str) -> Optional[str]:
+    """Return a frame's path relative to the project, or None to skip it.
+
+    Only frames inside the project and outside the logging machinery count
+    as the caller. The answer never changes for a given source file, so it
+    is cached per filename.
+    """
+    if not filename.startswith(project_root):
+        return None
+
+    normalized_path = filename.replace("\\", "/")
+    rel_normalized = normalized_path.replace(project_root.replace("\\", "/"), "")
+    if LOGGING_FRAME_RE.search(rel_normalized):
+        return None
+
+    try:
+        return os.path.relpath(filename, project_root)
+    except (ValueError, OSError):
+        return os.path.basename(filename)
 
 
 class BaseLogger(ABC):
+    # Empty so that subclasses declaring __slots__ get no instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def info(self, message: str, **kwargs):
         pass
@@ -1,6 +1,7 @@
 import json
+import logging
 
-from .base import BaseLogger
+from .base import BaseLogger, is_sensitive_field
 from .file import FileLogger
 from .stream import StreamLogger
 
@@ -9,27 +10,19 @@ def _prettify_extra(extra):
     if not extra:
         return ""
 
-    # Apply PII sanitization to extra data before displaying
-    _sensitive_fields = {
-        "password",
-        "token",
-        "secret",
-        "key",
-        "auth",
-        "credentials",
-        "api_key",
-    }
-
-    sanitized_extra = {}
-    for key, value in extra.items():
-        if key.lower() in _sensitive_fields:
-            sanitized_extra[key] = "[REDACTED]"
-        else:
-            sanitized_extra[key] = value
+    # Apply PII sanitization to extra data before displaying; the common
+    # case has nothing to redact, so only copy the dict when needed
+    sanitized_extra = extra
+    if any(is_sensitive_field(key) for key in extra):
+        sanitized_extra = {
+            key: "[REDACTED]" if is_sensitive_field(key) else value
+            for key, value in extra.items()
+        }
 
     try:
         return f" | extra: {json.dumps(sanitized_extra, ensure_ascii=False)}"
-    except Exception:
+    except (TypeError, ValueError):
+        # Values json cannot encode, or circular references
         return f" | extra: {str(sanitized_extra)}"
 
 
@@ -44,6 +37,10 @@ class BothLogger(BaseLogger):
         self.level = level
         self.service_name = service_name
 
+    def _stream_enabled_for(self, level: int) -> bool:
+        """Check the stream level before redacting and serialising extra."""
+        return self.stream_logger.logger.isEnabledFor(level)
+
     def log(self, message: str, level: str = None):
         self.file_logger.log(message, level)
         self.stream_logger.log(message, level)
@@ -52,25 +49,29 @@ class BothLogger(BaseLogger):
         extra = kwargs.get("extra")
         stacklevel = kwargs.pop("stacklevel", 6)  # Set higher default
         self.file_logger.info(message, **{**kwargs, "stacklevel": stacklevel})
-        self.stream_logger.info(message + _prettify_extra(extra))
+        if self._stream_enabled_for(logging.INFO):
+            self.stream_logger.info(message + _prettify_extra(extra))
 
     def warning(self, message: str, **kwargs):
         extra = kwargs.get("extra")
         stacklevel = kwargs.pop("stacklevel", 6)
         self.file_logger.warning(message, **{**kwargs, "stacklevel": stacklevel})
-        self.stream_logger.warning(message + _prettify_extra(extra))
+        if self._stream_enabled_for(logging.WARNING):
+            self.stream_logger.warning(message + _prettify_extra(extra))
 
     def error(self, message: str, **kwargs):
         extra = kwargs.get("extra")
         stacklevel = kwargs.pop("stacklevel", 6)
         self.file_logger.error(message, **{**kwargs, "stacklevel": stacklevel})
-        self.stream_logger.error(message + _prettify_extra(extra))
+        if self._stream_enabled_for(logging.ERROR):
+            self.stream_logger.error(message + _prettify_extra(extra))
 
     def debug(self, message: str, **kwargs):
         extra = kwargs.get("extra")
         stacklevel = kwargs.pop("stacklevel", 6)
         self.file_logger.debug(message, **{**kwargs, "stacklevel": stacklevel})
-        self.stream_logger.debug(message + _prettify_extra(extra))
+        if self._stream_enabled_for(logging.DEBUG):
+            self.stream_logger.debug(message + _prettify_extra(extra))
 
     def exception(self, message: str, *args, **kwargs):
         extra = kwargs.get("extra")
@@ -1,31 +1,23 @@
-import inspect
 import json
-import os
+import logging
 import random
+import sys
 
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.logging import correlation_paths
 
 from app.helpers.environment import env
 
-from .base import BaseLogger
+from .base import PROJECT_ROOT, BaseLogger, caller_relative_path, is_sensitive_field
 
 
 class CloudWatchLogger(BaseLogger):
+    __slots__ = ("sample_rate", "logger", "project_root")
+
     def __init__(
         self, service_name: str, level: str = "INFO", sample_rate: float = None
     ):
         self.sample_rate = sample_rate or float(env("LOG_SAMPLE_RATE", "1.0"))
-        # Define sensitive field names for PII sanitization
-        self._sensitive_fields = {
-            "password",
-            "token",
-            "secret",
-            "key",
-            "auth",
-            "credentials",
-            "api_key",
-        }
 
         # Keep the default location behavior but we'll override it per call
         self.logger = Logger(
@@ -34,18 +26,21 @@ class CloudWatchLogger(BaseLogger):
             correlation_id_path=correlation_paths.API_GATEWAY_REST,
             use_rfc3339=True,
         )
-        self.project_root = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "../../..")
-        )
+        self.project_root = PROJECT_ROOT
 
         # Override the formatter to use our custom location
         self._setup_custom_formatter()
 
     def _setup_custom_formatter(self):
         """Setup custom formatter that uses our location detection."""
+        environment = env("APP_ENVIRONMENT", "unknown")
+        version = env("APP_VERSION", "unknown")
+
         for handler in self.logger._logger.handlers:
-            if hasattr(handler, "formatter"):
-                original_format = handler.formatter.format
+            # Handlers always have the attribute, but it may be unset
+            formatter = getattr(handler, "formatter", None)
+            if formatter is not None:
+                original_format = formatter.format
 
                 def custom_format(record):
                     # Get original formatted message
@@ -55,18 +50,21 @@ class CloudWatchLogger(BaseLogger):
                     try:
                         log_data = json.loads(original_msg)
                         # Replace location with our custom caller_location if it exists
-                        if hasattr(record, "caller_location"):
-                            log_data["location"] = record.caller_location
+                        caller_location = getattr(record, "caller_location", None)
+                        if caller_location is not None:
+                            log_data["location"] = caller_location
 
                         # Add environment metadata
-                        log_data["environment"] = env("APP_ENVIRONMENT", "unknown")
-                        log_data["version"] = env("APP_VERSION", "unknown")
+                        log_data["environment"] = environment
+                        log_data["version"] = version
 
-                        # Sanitize sensitive data in extra field
-                        if "extra" in log_data and isinstance(log_data["extra"], dict):
-                            for key in list(log_data["extra"].keys()):
-                                if key.lower() in self._sensitive_fields:
-                                    log_data["extra"][key] = "[REDACTED]"
+                        # Sanitize sensitive data in extra field. Only values
+                        # are replaced, so the keys can be iterated in place
+                        extra = log_data.get("extra")
+                        if extra and isinstance(extra, dict):
+                            for key in extra:
+                                if is_sensitive_field(key):
+                                    extra[key] = "[REDACTED]"
 
                         return json.dumps(log_data)
                     except (json.JSONDecodeError, AttributeError):
@@ -75,44 +73,41 @@ class CloudWatchLogger(BaseLogger):
                     return original_msg
 
                 # Monkey patch the formatter
-                handler.formatter.format = custom_format
+                formatter.format = custom_format
 
     def _get_caller_location(self):
         """Get the actual caller location, excluding logging-related files."""
-        stack = inspect.stack()
-        for frame_info in stack:
-            filename = frame_info.filename
-            # Only consider frames inside the project root and outside
-            # the logging-related directories
-            normalized_path = filename.replace("\\", "/")
-            rel_normalized = normalized_path.replace(
-                self.project_root.replace("\\", "/"), ""
-            )
-
-            # Skip frames from logging-related files
-            is_logging_frame = (
-                "/services/logging/" in rel_normalized
-                or "/helpers/logger.py" in rel_normalized
-                or "/logging/" in rel_normalized
-            )
-
-            if filename.startswith(self.project_root) and not is_logging_frame:
-                try:
-                    rel_path = os.path.relpath(filename, self.project_root)
-                    return f"{rel_path}:{frame_info.lineno}"
-                except (ValueError, OSError):
-                    return f"{os.path.basename(filename)}:{frame_info.lineno}"
+        # Walk raw frames; inspect.stack() would also read source context
+        # for every frame on the stack
+        frame = sys._getframe()
+        while frame is not None:
+            rel_path = caller_relative_path(frame.f_code.co_filename, self.project_root)
+            if rel_path is not None:
+                return f"{rel_path}:{frame.f_lineno}"
+            frame = frame.f_back
 
         # Fallback
         return "unknown:0"
 
+    def _should_log(self, level: int) -> bool:
+        """Decide whether a call at ``level`` is emitted at all.
+
+        Runs before any location lookup or extra handling so filtered and
+        sampled-out calls do no other work.
+        """
+        return self.logger._logger.isEnabledFor(level) and self._should_sample_log()
+
     def _should_sample_log(self) -> bool:
         """Determine if this log should be sampled based on sample rate."""
-        return random.random() <= self.sample_rate
+        sample_rate = self.sample_rate
+        # The default rate of 1.0 keeps every log; skip the random draw
+        if sample_rate >= 1.0:
+            return True
+        return random.random() < sample_rate
 
     def info(self, message: str, **kwargs):
-        # Apply sampling for high-volume scenarios
-        if not self._should_sample_log():
+        # Apply level filtering and sampling for high-volume scenarios
+        if not self._should_log(logging.INFO):
             return
 
         location = self._get_caller_location()
@@ -120,40 +115,40 @@ class CloudWatchLogger(BaseLogger):
         self.logger.info(message, extra=kwargs, caller_location=location)
 
     def error(self, message: str, **kwargs):
-        # Apply sampling for high-volume scenarios
-        if not self._should_sample_log():
+        # Apply level filtering and sampling for high-volume scenarios
+        if not self._should_log(logging.ERROR):
             return
 
         location = self._get_caller_location()
         self.logger.error(message, extra=kwargs, caller_location=location)
 
     def warning(self, message: str, **kwargs):
-        # Apply sampling for high-volume scenarios
-        if not self._should_sample_log():
+        # Apply level filtering and sampling for high-volume scenarios
+        if not self._should_log(logging.WARNING):
             return
 
         location = self._get_caller_location()
         self.logger.warning(message, extra=kwargs, caller_location=location)
 
     def debug(self, message: str, **kwargs):
-        # Apply sampling for high-volume scenarios
-        if not self._should_sample_log():
+        # Apply level filtering and sampling for high-volume scenarios
+        if not self._should_log(logging.DEBUG):
             return
 
         location = self._get_caller_location()
         self.logger.debug(message, extra=kwargs, caller_location=location)
 
     def exception(self, message: str, **kwargs):
-        # Apply sampling for high-volume scenarios
-        if not self._should_sample_log():
+        # Apply level filtering and sampling for high-volume scenarios
+        if not self._should_log(logging.ERROR):
             return
 
         location = self._get_caller_location()
         self.logger.exception(message, extra=kwargs, caller_location=location)
 
     def critical(self, message: str, **kwargs):
-        # Apply sampling for high-volume scenarios
-        if not self._should_sample_log():
+        # Apply level filtering and sampling for high-volume scenarios
+        if not self._should_log(logging.CRITICAL):
             return
 
         location = self._get_caller_location()
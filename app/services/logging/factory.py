@@ -1,14 +1,15 @@
-from typing import Dict, List, Optional, Type
+import importlib
+from typing import Dict, List, Optional, Tuple, Type
 
 from app.helpers.environment import env
-from app.services.logging.both import BothLogger
-from app.services.logging.cloud import CloudWatchLogger
-from app.services.logging.file import FileLogger
-from app.services.logging.stream import StreamLogger
 
 from .base import BaseLogger
 
 
+# Logger types that accept a sample_rate argument
+_SAMPLED_LOGGER_TYPES = frozenset({"file", "cloud", "both"})
+
+
 class LoggerFactory:
     """Factory class for creating different types of loggers with lazy
     loading support."""
@@ -16,31 +17,42 @@ class LoggerFactory:
     # Cache for lazy-loaded logger classes
     _lazy_logger_cache: Dict[str, Type[BaseLogger]] = {}
 
-    # Registry of available logger types
-    _logger_registry = {
-        "stream": StreamLogger,
-        "file": FileLogger,
-        "cloud": CloudWatchLogger,
-        "both": BothLogger,
+    # Registry of available logger types, as (module path, class name) so a
+    # logger's dependencies are only imported when that type is requested
+    _logger_registry: Dict[str, Tuple[str, str]] = {
+        "stream": ("app.services.logging.stream", "StreamLogger"),
+        "file": ("app.services.logging.file", "FileLogger"),
+        "cloud": ("app.services.logging.cloud", "CloudWatchLogger"),
+        "both": ("app.services.logging.both", "BothLogger"),
     }
 
     @classmethod
     def _resolve_logger_type(cls, logger_type: Optional[str]) -> str:
         """Resolve the logger type from parameters or environment variables."""
-        return (logger_type or env("LOGGER_TYPE", env("LOG_CHANNEL", "file"))).lower()
+        # Each source is only read when the previous one is unset
+        return (logger_type or env("LOGGER_TYPE") or env("LOG_CHANNEL", "file")).lower()
 
     @classmethod
-    def _get_logger_params(
-        cls, service_name: str, level: str, logger_type: str
-    ) -> Dict:
-        """Get common parameters for logger initialization."""
-        base_params = {"service_name": service_name, "level": level}
+    def _load_logger_class(cls, logger_type: str) -> Type[BaseLogger]:
+        """Import the logger class for a type on first use and cache it."""
+        logger_class = cls._lazy_logger_cache.get(logger_type)
+        if logger_class is None:
+            module_path, class_name = cls._logger_registry[logger_type]
+            logger_class = getattr(importlib.import_module(module_path), class_name)
+            cls._lazy_logger_cache[logger_type] = logger_class
+        return logger_class
 
-        # Add sample_rate for loggers that support it
-        if logger_type in ["file", "cloud", "both"]:
-            base_params["sample_rate"] = float(env("LOG_SAMPLE_RATE", "1.0"))
+    @classmethod
+    def _get_logger_params(cls, logger_type: str) -> Dict[str, float]:
+        """Get extra constructor arguments for a logger type.
 
-        return base_params
+        Read on every build, not cached, so a reloaded configuration
+        reaches loggers created afterwards.
+        """
+        # Add sample_rate for loggers that support it
+        if logger_type in _SAMPLED_LOGGER_TYPES:
+            return {"sample_rate": float(env("LOG_SAMPLE_RATE", "1.0"))}
+        return {}
 
     @classmethod
     def get_supported_types(cls) -> List[str]:
@@ -70,12 +82,15 @@ class LoggerFactory:
             ImportError: If required dependencies for the logger type are not available
         """
         resolved_type = cls._resolve_logger_type(logger_type)
-        params = cls._get_logger_params(service_name, level, resolved_type)
 
         # Handle logger types
         if resolved_type in cls._logger_registry:
-            logger_class = cls._logger_registry[resolved_type]
-            return logger_class(**params)
+            logger_class = cls._load_logger_class(resolved_type)
+            return logger_class(
+                service_name=service_name,
+                level=level,
+                **cls._get_logger_params(resolved_type),
+            )
 
         # Unknown logger type
         else:
@@ -1,14 +1,50 @@
-import inspect
-import json
+import atexit
 import logging
 import os
+import queue
 import random
+import sys
 from datetime import datetime, timezone
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict
 
 from app.helpers.environment import env
+from app.helpers.serializer import json_dumps
 
-from .base import BaseLogger
+from .base import PROJECT_ROOT, BaseLogger, caller_relative_path, is_sensitive_field
+
+
+_LEVEL_NUMBERS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+# Records waiting for the container-mode file writer; once full, new records
+# are dropped and counted instead of growing memory behind a stalled disk
+LOG_QUEUE_MAX_SIZE = 10000
+
+# Running container-mode file writers, one per logger name
+_listeners: Dict[str, QueueListener] = {}
+
+
+def _close_listener(listener: QueueListener):
+    """Flush queued records, stop the writer thread and close its files."""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def _stop_all_listeners():
+    """Flush and stop every background file writer at interpreter exit."""
+    while _listeners:
+        _, listener = _listeners.popitem()
+        _close_listener(listener)
+
+
+atexit.register(_stop_all_listeners)
 
 
 class FileLogger(BaseLogger):
@@ -35,20 +71,46 @@ class FileLogger(BaseLogger):
         max_bytes: int,
         backup_count: int,
     ) -> logging.Logger:
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        os.makedirs(log_dir, exist_ok=True)
 
-        logger = logging.getLogger(f"{service_name}_file")
+        logger_name = f"{service_name}_file"
+        logger = logging.getLogger(logger_name)
         logger.setLevel(level)
+        # Rebuilding a logger replaces its handlers, so the old ones are
+        # flushed and closed rather than left holding the log file open
+        previous = _listeners.pop(logger_name, None)
+        if previous is not None:
+            _close_listener(previous)
+        for handler in logger.handlers:
+            handler.close()
         logger.handlers = []
 
         file_handler = RotatingFileHandler(
             f"{log_dir}/{service_name}.log",
             maxBytes=max_bytes,
             backupCount=backup_count,
+            # JSON lines carry non-ASCII text unescaped
+            encoding="utf-8",
         )
-        file_handler.setFormatter(self._create_json_formatter(service_name))
-        logger.addHandler(file_handler)
+        formatter = self._create_json_formatter(service_name)
+
+        if env("APP_RUNTIME", "lambda") == "container":
+            # Long-running containers hand file writes to a background
+            # listener. Records are still formatted on the calling thread
+            # because the caller location is read from its stack.
+            log_queue = queue.Queue(maxsize=LOG_QUEUE_MAX_SIZE)
+            queue_handler = _DroppingQueueHandler(log_queue)
+            queue_handler.setFormatter(formatter)
+            file_handler.setFormatter(logging.Formatter("%(message)s"))
+
+            listener = QueueListener(log_queue, file_handler)
+            listener.start()
+            _listeners[logger_name] = listener
+            logger.addHandler(queue_handler)
+        else:
+            file_handler.setFormatter(formatter)
+            logger.addHandler(file_handler)
+
         return logger
 
     def _create_json_formatter(self, service_name: str):
@@ -57,15 +119,25 @@ class FileLogger(BaseLogger):
 
     def _should_sample_log(self) -> bool:
         """Determine if this log should be sampled based on sample rate."""
-        return random.random() <= self.sample_rate
+        sample_rate = self.sample_rate
+        # The default rate of 1.0 keeps every log; skip the random draw
+        if sample_rate >= 1.0:
+            return True
+        return random.random() < sample_rate
 
     def _log(self, level: str, message: str, **kwargs):
+        level = level.lower()
+        # Skip filtered levels before sampling or touching kwargs
+        if not self.logger.isEnabledFor(_LEVEL_NUMBERS.get(level, logging.INFO)):
+            return
+
         # Apply sampling for high-volume scenarios
         if not self._should_sample_log():
             return
 
-        log_method = getattr(self.logger, level.lower())
-        extra = kwargs.pop("extra", {})
+        log_method = getattr(self.logger, level)
+        # An empty extra is passed as None so logging skips merging it
+        extra = kwargs.pop("extra", None) or None
         stacklevel = kwargs.pop("stacklevel", 1)
 
         # Python logging expects extra fields as part of the extra dict
@@ -95,6 +167,9 @@ class FileLogger(BaseLogger):
         self._log("debug", message, **kwargs)
 
     def exception(self, message: str, **kwargs):
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+
         stacklevel = kwargs.pop("stacklevel", 1)
         self.logger.exception(message, extra=kwargs, stacklevel=stacklevel)
 
@@ -108,38 +183,78 @@ class FileLogger(BaseLogger):
         return wrapper
 
 
+# LogRecord attributes that are never copied into the JSON entry as extras
+_STANDARD_RECORD_FIELDS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "message",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "extra",
+    }
+)
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """Queue handler that drops and counts records while the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
 class _JsonFormatter(logging.Formatter):
     """JSON formatter for file logging."""
 
-    _project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
-    _sensitive_fields = {
-        "password",
-        "token",
-        "secret",
-        "key",
-        "auth",
-        "credentials",
-        "api_key",
-    }
+    _project_root = PROJECT_ROOT
 
     def __init__(self, service_name: str):
         super().__init__()
         self.service_name = service_name
+        # Deployment metadata does not change for the life of the process
+        self.environment = env("APP_ENVIRONMENT", "unknown")
+        self.version = env("APP_VERSION", "unknown")
 
     def format(self, record):
         rel_path, lineno = self._get_caller_location(record)
         log_entry = self._build_log_entry(record, rel_path, lineno)
         self._sanitize_extra_fields(record, log_entry)
-        return json.dumps(log_entry)
+        return json_dumps(log_entry)
 
     def _get_caller_location(self, record):
         """Get caller location from stack trace."""
-        stack = inspect.stack()
-        for frame_info in stack:
-            filename = frame_info.filename
-            if self._is_valid_frame(filename):
-                rel_path = os.path.relpath(filename, self._project_root)
-                return rel_path, frame_info.lineno
+        # Walk raw frames; inspect.stack() would also read source context
+        # for every frame on the stack
+        frame = sys._getframe()
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            rel_path = caller_relative_path(filename, self._project_root)
+            if rel_path is not None:
+                return rel_path, frame.f_lineno
+            frame = frame.f_back
 
         return self._get_fallback_location(record)
 
@@ -151,68 +266,34 @@ class _JsonFormatter(logging.Formatter):
         except (ValueError, OSError):
             return os.path.basename(record.pathname), record.lineno
 
-    def _is_valid_frame(self, filename):
-        """Check if frame is valid for logging location."""
-        if not filename.startswith(self._project_root):
-            return False
-
-        normalized_path = filename.replace("\\", "/")
-        rel_normalized = normalized_path.replace(
-            self._project_root.replace("\\", "/"), ""
-        )
-
-        return not any(
-            pattern in rel_normalized
-            for pattern in ["/services/logging/", "/helpers/logger.py", "/logging/"]
-        )
-
     def _build_log_entry(self, record, rel_path, lineno):
         """Build base log entry."""
+        # The record already carries its creation time; reuse it
+        timestamp = datetime.fromtimestamp(record.created, timezone.utc)
         log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": timestamp.isoformat(),
             "level": record.levelname,
             "service": self.service_name,
             "message": record.getMessage(),
             "location": f"{rel_path}:{lineno}",
-            "environment": env("APP_ENVIRONMENT", "unknown"),
-            "version": env("APP_VERSION", "unknown"),
+            "environment": self.environment,
+            "version": self.version,
         }
 
         if record.exc_info:
-            log_entry["exception"] = self.formatException(record.exc_info)
+            # Cache the traceback text on the record like logging.Formatter
+            # does, so it is only rendered once across handlers
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_entry["exception"] = record.exc_text
 
         return log_entry
 
     def _sanitize_extra_fields(self, record, log_entry):
         """Add extra fields with PII sanitization."""
-        standard_fields = {
-            "name",
-            "msg",
-            "args",
-            "levelname",
-            "levelno",
-            "pathname",
-            "filename",
-            "module",
-            "lineno",
-            "funcName",
-            "created",
-            "msecs",
-            "relativeCreated",
-            "thread",
-            "threadName",
-            "processName",
-            "process",
-            "message",
-            "exc_info",
-            "exc_text",
-            "stack_info",
-            "extra",
-        }
-
         for key, value in record.__dict__.items():
-            if key not in standard_fields:
-                if key.lower() in self._sensitive_fields:
+            if key not in _STANDARD_RECORD_FIELDS:
+                if is_sensitive_field(key):
                     log_entry[key] = "[REDACTED]"
                 else:
                     log_entry[key] = value
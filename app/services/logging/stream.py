@@ -22,6 +22,15 @@ LEVEL_COLORS = {
 }
 RESET = Style.RESET_ALL if COLORAMA_AVAILABLE else ""
 
+# Logger method for each level name; anything else falls back to ``info``
+LEVEL_METHODS = {
+    "DEBUG": "debug",
+    "INFO": "info",
+    "WARNING": "warning",
+    "ERROR": "error",
+    "CRITICAL": "critical",
+}
+
 
 class StreamLogger(BaseLogger):
     def __init__(self, service_name: str, level: str = "INFO"):
@@ -37,35 +46,50 @@ class StreamLogger(BaseLogger):
         self.logger.addHandler(handler)
         self.logger.setLevel(getattr(logging, level.upper(), logging.INFO))
         self.logger.propagate = False
+        # Everything around the timestamp is fixed per level and service
+        self._prefixes = {
+            level_name: self._build_prefix(level_name) for level_name in LEVEL_COLORS
+        }
+
+    def _build_prefix(self, level: str):
+        color = LEVEL_COLORS.get(level, "")
+        return f"{color}[", f"] [{level}] {self.service_name}:{RESET} "
 
     def _format_message(self, level: str, message: str, extra=None):
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        color = LEVEL_COLORS.get(level, "")
-        reset = RESET
+        prefixes = self._prefixes.get(level)
+        if prefixes is None:
+            prefixes = self._build_prefix(level)
+        head, tail = prefixes
         extra_str = f" | extra: {extra}" if extra else ""
-        return (
-            f"{color}[{timestamp}] [{level}] {self.service_name}:{reset} "
-            f"{message}{extra_str}"
-        )
+        return f"{head}{timestamp}{tail}{message}{extra_str}"
 
     def log(self, message: str, level: str = None, **kwargs):
         level = (level or self.level).upper()
         extra = kwargs.get("extra")
         formatted = self._format_message(level, message, extra)
-        log_method = getattr(self.logger, level.lower(), self.logger.info)
+        log_method = getattr(
+            self.logger, LEVEL_METHODS.get(level, "info"), self.logger.info
+        )
         log_method(formatted)
 
+    # The level-specific methods know their level, so they skip the name
+    # normalisation and method lookup done by ``log``
     def info(self, message: str, **kwargs):
-        self.log(message, level="INFO", **kwargs)
+        formatted = self._format_message("INFO", message, kwargs.get("extra"))
+        self.logger.info(formatted)
 
     def warning(self, message: str, **kwargs):
-        self.log(message, level="WARNING", **kwargs)
+        formatted = self._format_message("WARNING", message, kwargs.get("extra"))
+        self.logger.warning(formatted)
 
     def error(self, message: str, **kwargs):
-        self.log(message, level="ERROR", **kwargs)
+        formatted = self._format_message("ERROR", message, kwargs.get("extra"))
+        self.logger.error(formatted)
 
     def debug(self, message: str, **kwargs):
-        self.log(message, level="DEBUG", **kwargs)
+        formatted = self._format_message("DEBUG", message, kwargs.get("extra"))
+        self.logger.debug(formatted)
 
     def exception(self, message: str, *args, **kwargs):
         extra = kwargs.get("extra")
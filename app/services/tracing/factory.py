@@ -4,10 +4,16 @@ from typing import Optional
 from app.helpers.environment import env
 
 from .base import BaseTracer
-from .cloud import CloudTracer
 from .local import LocalTracer
 
 
+def _cloud_tracer(service: str) -> BaseTracer:
+    # aws_xray_sdk is only imported once a cloud tracer is actually needed
+    from .cloud import CloudTracer
+
+    return CloudTracer(service)
+
+
 class TracerFactory:
     @staticmethod
     def create_tracer(
@@ -38,7 +44,7 @@ class TracerFactory:
             if chosen in ("local",):
                 return LocalTracer(service)
             if chosen in ("cloud", "aws", "xray"):
-                return CloudTracer(service)
+                return _cloud_tracer(service)
             # unknown explicit value -> raise to surface misconfiguration
             raise ValueError(f"Unknown tracer_type override: {tracer_type!r}")
 
@@ -46,14 +52,17 @@ class TracerFactory:
         if environment == "local":
             return LocalTracer(service)
 
-        return CloudTracer(service)
+        return _cloud_tracer(service)
 
 
 def validate_service_name(service_name):
     """Validate service name"""
-    if not service_name or not service_name.strip():
+    if not service_name or service_name.isspace():
         raise ValueError("Invalid service name")
-    return service_name.strip()
+    # Most names are already trimmed; only strip when there is padding
+    if service_name[0].isspace() or service_name[-1].isspace():
+        return service_name.strip()
+    return service_name
 
 
 @lru_cache
@@ -1,11 +1,12 @@
-import json
 from contextlib import contextmanager
 from datetime import datetime
 from functools import wraps
 from pathlib import Path
-from time import time
+from time import perf_counter
 from typing import Any, Dict, Optional
 
+from app.helpers.serializer import json_dumps
+
 from .base import BaseTracer
 
 
@@ -29,7 +30,7 @@ class LocalTracer(BaseTracer):
             "segment": segment_name,
             "metadata": metadata or {},
         }
-        trace_message = json.dumps(trace_entry, default=str)
+        trace_message = json_dumps(trace_entry, default=str)
 
         with open(self.trace_file, "a") as f:
             f.write(trace_message + "\n")
@@ -38,11 +39,11 @@ class LocalTracer(BaseTracer):
     def capture_lambda_handler(self, handler):
         @wraps(handler)
         def wrapper(event, context):
-            start_time = time()
+            start_time = perf_counter()
             self._write_trace("lambda_handler", {"event": event})
             try:
                 result = handler(event, context)
-                end_time = time()
+                end_time = perf_counter()
                 processing_time = end_time - start_time
                 self._write_trace(
                     "lambda_handler_response",
@@ -50,7 +51,7 @@ class LocalTracer(BaseTracer):
                 )
                 return result
             except Exception as e:
-                end_time = time()
+                end_time = perf_counter()
                 processing_time = end_time - start_time
                 self._write_trace(
                     "lambda_handler_error",
@@ -63,16 +64,16 @@ class LocalTracer(BaseTracer):
     def capture_method(self, method):
         @wraps(method)
         def wrapper(*args, **kwargs):
-            start_time = time()
+            start_time = perf_counter()
             self._write_trace(method.__name__)
             try:
                 result = method(*args, **kwargs)
-                end_time = time()
+                end_time = perf_counter()
                 processing_time = end_time - start_time
                 self._write_trace(method.__name__, {"processing_time": processing_time})
                 return result
             except Exception as e:
-                end_time = time()
+                end_time = perf_counter()
                 processing_time = end_time - start_time
                 self._write_trace(
                     f"{method.__name__}_error",
@@ -84,12 +85,12 @@ class LocalTracer(BaseTracer):
 
     @contextmanager
     def create_segment(self, name: str, metadata: Optional[Dict[str, Any]] = None):
-        start_time = time()
+        start_time = perf_counter()
         self._write_trace(name, metadata)
         try:
             yield
         except Exception as e:
-            end_time = time()
+            end_time = perf_counter()
             processing_time = end_time - start_time
             self._write_trace(
                 f"{name}_error",
@@ -97,6 +98,6 @@ class LocalTracer(BaseTracer):
             )
             raise
         else:
-            end_time = time()
+            end_time = perf_counter()
             processing_time = end_time - start_time
             self._write_trace(name, {"processing_time": processing_time})
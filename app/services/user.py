@@ -47,7 +47,7 @@ class UserService:
         """
         user = self.db.query(User).filter(User.id == id).first()
         if not user:
-            raise UserNotFoundException("User not found")
+            raise UserNotFoundException()
         return user
 
     def filter(self, *conditions):
@@ -87,10 +87,10 @@ class UserService:
             query = query.filter(User.username == username)
 
         # Sorting logic
-        if not hasattr(User, sort_by):
+        sort_column = getattr(User, sort_by, None)
+        if sort_column is None:
             raise InvalidSortFieldException("Invalid sort field or sort type")
 
-        sort_column = getattr(User, sort_by)
         query = query.order_by(
             asc(sort_column) if sort_type == "asc" else desc(sort_column)
         )
@@ -98,22 +98,12 @@ class UserService:
         # Retrieve filtered and paginated results from MockSession
         users = query.offset(offset).limit(items_per_page).all()
 
-        # Apply date filtering directly within UserService
-        if start_date and end_date:
-            users = [
-                user for user in users if start_date <= user.created_at <= end_date
-            ]
-
-        # Convert users to response format
+        # Apply date filtering while converting users to response format
+        filter_dates = bool(start_date and end_date)
         users_response = [
-            UserResponse(
-                id=user.id,
-                username=user.username,
-                email=user.email,
-                created_at=user.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-                updated_at=user.updated_at.strftime("%Y-%m-%d %H:%M:%S"),
-            )
+            UserResponse.from_model(user)
             for user in users
+            if not filter_dates or start_date <= user.created_at <= end_date
         ]
 
         # Pagination details
@@ -197,13 +187,7 @@ class UserService:
             UserNotFoundException: If the user is not found.
         """
         user = self.get_by_id(id)
-        response = UserResponse(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            created_at=user.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-            updated_at=user.updated_at.strftime("%Y-%m-%d %H:%M:%S"),
-        )
+        response = UserResponse.from_model(user)
         self.db.delete(user)
         self.db.commit()
         return response
@@ -228,13 +212,7 @@ class UserService:
             UserNotFoundException: If the user is not found.
         """
         user = self.get_by_id(id)
-        return UserResponse(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            created_at=user.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-            updated_at=user.updated_at.strftime("%Y-%m-%d %H:%M:%S"),
-        )
+        return UserResponse.from_model(user)
 
     def bulk_delete(self, user_ids: List[int]) -> List[int]:
         users_to_delete = self.db.query(User).filter(User.id.in_(user_ids)).all()
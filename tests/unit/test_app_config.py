@@ -369,3 +369,28 @@ def test_storage_defaults_when_not_provided(mocker):
         for var, original_value in original_values.items():
             if original_value is not None:
                 os.environ[var] = original_value
+
+
+def test_env_variable_lookups_share_cached_settings(monkeypatch):
+    """Looking up individual variables should build the settings once."""
+    import app.helpers.environment as environment_mod
+
+    created = []
+
+    class FakeSettings:
+        APP_NAME = "test-app"
+        LOG_LEVEL = "INFO"
+
+        def __init__(self):
+            created.append(self)
+
+    monkeypatch.setattr(environment_mod, "EnvironmentVariables", FakeSettings)
+    env.cache_clear()
+
+    try:
+        assert env("APP_NAME") == "test-app"
+        assert env("LOG_LEVEL") == "INFO"
+        assert env("MISSING", "fallback") == "fallback"
+        assert len(created) == 1
+    finally:
+        env.cache_clear()
@@ -63,3 +63,18 @@ def test_app_service_error_handling(mock_boto3):
     svc.table.delete_item = MagicMock(side_effect=Exception("fail"))
     with pytest.raises(Exception):
         svc.remove_state("k")
+
+
+@patch("app.services.app.boto3")
+def test_app_service_defers_dynamodb_setup(mock_boto3):
+    dummy_resource = MagicMock()
+    dummy_resource.Table.return_value = DummyTable()
+    mock_boto3.resource.return_value = dummy_resource
+
+    svc = AppService()
+    mock_boto3.resource.assert_not_called()
+
+    svc.set_state("k", 1)
+    svc.get_state("k")
+    mock_boto3.resource.assert_called_once()
+    assert svc.dynamodb_resource is dummy_resource
@@ -133,6 +133,7 @@ def test_soft_delete_calls_save_and_sets_timestamps(mocker):
     assert repo.soft_delete_by_id("123") is True
     assert saved["entity"].deleted_at is not None
     assert saved["entity"].updated_at is not None
+    assert saved["entity"].deleted_at == saved["entity"].updated_at
 
 
 def test_list_by_entity_type_filters_and_skips_invalid(mocker):
@@ -406,3 +407,69 @@ def test_list_by_entity_type_include_deleted_true_no_deletion_filter(mocker):
 
     # ScanIndexForward should be False for desc
     assert captured.get("ScanIndexForward") is False
+
+
+def test_key_uses_entity_prefix_and_metadata_sk():
+    repo = make_repo_with_client(SimpleNamespace())
+    assert repo._key("42") == {"PK": {"S": "ENTITY#42"}, "SK": {"S": "METADATA"}}
+
+
+def test_key_prefix_uses_attributes_set_after_base_init():
+    class LateTypeRepo(RepoImpl):
+        def __init__(self, entity_type):
+            super().__init__()
+            self.entity_type = entity_type
+
+        def get_entity_type(self):
+            return self.entity_type
+
+    repo = LateTypeRepo("ORDER")
+    assert repo._key("7")["PK"] == {"S": "ORDER#7"}
+
+
+def test_iter_by_entity_type_follows_pages_and_skips_invalid(mocker):
+    pages = [
+        {
+            "Items": [
+                {"PK": {"S": "ENTITY#1"}, "SK": {"S": "METADATA"}, "Name": {"S": "a"}},
+                {
+                    "PK": {"S": "ENTITY#2"},
+                    "SK": {"S": "METADATA"},
+                    "Name": {"S": "bad"},
+                },
+            ],
+            "LastEvaluatedKey": {"PK": {"S": "ENTITY#2"}},
+        },
+        {
+            "Items": [
+                {"PK": {"S": "ENTITY#3"}, "SK": {"S": "METADATA"}, "Name": {"S": "c"}},
+            ],
+        },
+    ]
+    calls = []
+
+    def query(**k):
+        calls.append(k.get("ExclusiveStartKey"))
+        return pages[len(calls) - 1]
+
+    repo = make_repo_with_client(SimpleNamespace(query=query))
+
+    ids = [entity.id for entity in repo.iter_by_entity_type(page_size=2)]
+    assert ids == ["1", "3"]
+    assert calls == [None, {"PK": {"S": "ENTITY#2"}}]
+
+
+def test_batch_get_by_ids_returns_empty_when_a_batch_fails(mocker):
+    ids = [str(i) for i in range(1, 151)]
+
+    def batch_get_item(RequestItems):
+        keys = RequestItems["tbl"]["Keys"]
+        if not keys[0]["PK"]["S"].endswith("#1"):
+            raise Exception("throttled")
+        return {"Responses": {"tbl": []}}
+
+    repo = make_repo_with_client(
+        SimpleNamespace(batch_get_item=batch_get_item), table_name="tbl"
+    )
+
+    assert repo.batch_get_by_ids(ids) == []
@@ -0,0 +1,91 @@
+import json
+import uuid
+
+import pytest
+
+from app.services.logging import cloud as cloud_mod
+from app.services.logging.cloud import CloudWatchLogger
+
+
+def _make_logger(monkeypatch, level="INFO", sample_rate=1.0):
+    monkeypatch.setattr(
+        "app.services.logging.cloud.env",
+        lambda k, d=None: {"APP_ENVIRONMENT": "test", "APP_VERSION": "1.2.3"}.get(k, d),
+    )
+    # Powertools reuses the handler of an existing service logger, so each
+    # test gets its own service to write to its own captured stdout
+    return CloudWatchLogger(
+        service_name=f"svc-{uuid.uuid4().hex}", level=level, sample_rate=sample_rate
+    )
+
+
+def _last_entry(capsys):
+    lines = [line for line in capsys.readouterr().out.splitlines() if line]
+    return json.loads(lines[-1])
+
+
+def test_cloud_logger_filters_level_before_caller_lookup(monkeypatch, capsys):
+    logger = _make_logger(monkeypatch, level="INFO")
+
+    def fail_lookup(self):
+        raise AssertionError("caller location looked up for a filtered level")
+
+    # Slotted instances cannot be patched, so the method is patched on the class
+    monkeypatch.setattr(CloudWatchLogger, "_get_caller_location", fail_lookup)
+    logger.debug("quiet", extra={"foo": "bar"})
+
+    assert capsys.readouterr().out == ""
+
+
+def test_cloud_logger_full_sample_rate_skips_random(monkeypatch, capsys):
+    logger = _make_logger(monkeypatch, sample_rate=1.0)
+
+    def fail_random():
+        raise AssertionError("random() should not be called at a rate of 1.0")
+
+    monkeypatch.setattr(cloud_mod.random, "random", fail_random)
+    logger.info("kept")
+
+    assert _last_entry(capsys)["message"] == "kept"
+
+
+def test_cloud_logger_sampled_out_skips_caller_lookup(monkeypatch, capsys):
+    logger = _make_logger(monkeypatch, sample_rate=0.5)
+
+    def fail_lookup(self):
+        raise AssertionError("caller location looked up for a sampled-out call")
+
+    monkeypatch.setattr(cloud_mod.random, "random", lambda: 0.9)
+    monkeypatch.setattr(CloudWatchLogger, "_get_caller_location", fail_lookup)
+    logger.info("dropped")
+
+    assert capsys.readouterr().out == ""
+
+
+def test_cloud_logger_location_skips_logging_frames(monkeypatch, capsys):
+    logger = _make_logger(monkeypatch)
+
+    logger.info("located")
+
+    entry = _last_entry(capsys)
+    assert entry["location"].startswith("tests/unit/test_cloud_logger.py:")
+    assert entry["environment"] == "test"
+    assert entry["version"] == "1.2.3"
+
+
+@pytest.mark.parametrize("key", ["password", "Password", "API_KEY", "Token"])
+def test_cloud_logger_redacts_extra_case_insensitively(monkeypatch, capsys, key):
+    logger = _make_logger(monkeypatch)
+
+    logger.info("redacted", extra={key: "s3cret", "foo": "bar"})
+
+    extra = _last_entry(capsys)["extra"]
+    assert extra == {key: "[REDACTED]", "foo": "bar"}
+
+
+def test_cloud_logger_has_no_instance_dict(monkeypatch):
+    logger = _make_logger(monkeypatch)
+
+    assert not hasattr(logger, "__dict__")
+    with pytest.raises(AttributeError):
+        logger.unexpected = True
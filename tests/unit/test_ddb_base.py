@@ -1,4 +1,6 @@
-from datetime import datetime
+from datetime import date, datetime
+from enum import Enum, IntEnum
+from typing import Optional
 
 from app.models.ddb.ddb_base import DDBModel
 
@@ -78,3 +80,41 @@ def test_get_entity_type():
         meta={},
     )
     assert model.get_entity_type() == "DUMMYDDBMODEL"
+
+
+class Role(str, Enum):
+    ADMIN = "admin"
+
+
+class Level(IntEnum):
+    HIGH = 3
+
+
+class TypedDDBModel(DDBModel):
+    role: Role
+    level: Level
+    ratio: float
+    birthday: date
+    nickname: Optional[str] = None
+
+    def pk(self) -> str:
+        return "TYPED#1"
+
+    def sk(self) -> str:
+        return "METADATA"
+
+    @classmethod
+    def from_ddb_item(cls, item):
+        raise NotImplementedError
+
+
+def test_to_ddb_item_subclasses_and_fallback():
+    model = TypedDDBModel(
+        role=Role.ADMIN, level=Level.HIGH, ratio=0.5, birthday=date(2000, 1, 2)
+    )
+    item = model.to_ddb_item()
+    assert item["role"] == {"S": Role.ADMIN}
+    assert item["level"] == {"N": str(Level.HIGH)}
+    assert item["ratio"] == {"N": "0.5"}
+    assert item["birthday"] == {"S": "2000-01-02"}
+    assert "nickname" not in item
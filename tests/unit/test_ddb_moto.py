@@ -47,3 +47,25 @@ def test_get_dynamodb_clients_with_mocked_boto3(mocker):
     assert resource is fake_resource
     assert client is fake_client
     assert table is fake_table
+
+
+def test_get_dynamodb_clients_verifies_connection_only_when_enabled(mocker):
+    calls = []
+    fake_client = SimpleNamespace(
+        describe_table=lambda TableName: calls.append(TableName)
+        or {"Table": {"TableStatus": "ACTIVE"}}
+    )
+    fake_resource = SimpleNamespace(Table=lambda name: SimpleNamespace(name=name))
+    mocker.patch("app.helpers.ddb.boto3.resource", return_value=fake_resource)
+    mocker.patch("app.helpers.ddb.boto3.client", return_value=fake_client)
+
+    for verify in (False, True):
+        settings = SimpleNamespace(
+            DDB_TYPE="local", DDB_TABLE_NAME="tbl", DDB_VERIFY_CONNECTION=verify
+        )
+        mocker.patch("app.helpers.ddb.env", return_value=settings)
+        ddb_mod.get_dynamodb_clients.cache_clear()
+        ddb_mod.get_dynamodb_clients()
+
+    ddb_mod.get_dynamodb_clients.cache_clear()
+    assert calls == ["tbl"]
@@ -6,6 +6,7 @@ from app.exceptions.user import (
     InvalidSortFieldException,
     InvalidSortTypeException,
     UnauthorizedException,
+    UserException,
     UserNotFoundException,
 )
 
@@ -53,3 +54,16 @@ def test_invalid_sort_type_exception():
     assert str(exc.value) == "Invalid sort type"
     e = InvalidSortTypeException("custom")
     assert str(e) == "custom"
+
+
+def test_user_exceptions_share_base_and_message():
+    e = UserNotFoundException()
+    assert isinstance(e, UserException)
+    assert e.message == "User not found"
+    assert UnauthorizedException("custom").message == "custom"
+
+
+def test_user_exception_message_is_slotted():
+    e = InvalidSortFieldException()
+    assert e.message == "Invalid sort field"
+    assert e.__dict__ == {}
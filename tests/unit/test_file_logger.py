@@ -200,3 +200,182 @@ def test_file_logger_json_schema_and_pii_cases(tmp_path, monkeypatch):
     # Nested sensitive field inside dict is not automatically redacted
     # by current implementation
     assert entry.get("nested") == {"token": "x"}
+
+
+def test_file_logger_full_sample_rate_skips_random(tmp_path, monkeypatch):
+    """A sample rate of 1.0 should always log without drawing a random number."""
+    import app.services.logging.file as file_mod
+    from app.services.logging.file import FileLogger
+
+    monkeypatch.setattr(
+        "app.services.logging.file.env",
+        lambda k, d=None: {"APP_ENVIRONMENT": "test", "APP_VERSION": "1.2.3"}.get(k, d),
+    )
+
+    def fail_random():
+        raise AssertionError("random.random should not be called")
+
+    fl = FileLogger(
+        service_name="svc", level="INFO", log_dir=str(tmp_path), sample_rate=1.0
+    )
+    monkeypatch.setattr(file_mod.random, "random", fail_random)
+
+    assert fl._should_sample_log() is True
+
+
+def test_file_logger_container_runtime_writes_through_queue(tmp_path, monkeypatch):
+    """In a container runtime, file writes go through a queue listener."""
+    from app.services.logging import file as file_mod
+    from app.services.logging.file import FileLogger
+
+    monkeypatch.setattr(
+        "app.services.logging.file.env",
+        lambda k, d=None: {
+            "APP_ENVIRONMENT": "test",
+            "APP_VERSION": "1.2.3",
+            "APP_RUNTIME": "container",
+        }.get(k, d),
+    )
+
+    fl = FileLogger(
+        service_name="svc", level="INFO", log_dir=str(tmp_path), sample_rate=1.0
+    )
+    assert "svc_file" in file_mod._listeners
+
+    fl.info("queued", extra={"foo": "bar", "token": "t"})
+    # Stopping the listeners drains the queue
+    file_mod._stop_all_listeners()
+    assert file_mod._listeners == {}
+
+    lines = [line for line in (tmp_path / "svc.log").read_text().splitlines() if line]
+    entry = json.loads(lines[-1])
+    assert entry["message"] == "queued"
+    assert entry["foo"] == "bar"
+    assert entry["token"] == "[REDACTED]"
+    assert entry["location"].startswith("tests")
+
+
+def test_file_logger_rebuild_closes_previous_listener(tmp_path, monkeypatch):
+    """Rebuilding a container-mode logger flushes and closes the old writer."""
+    from app.services.logging import file as file_mod
+    from app.services.logging.file import FileLogger
+
+    monkeypatch.setattr(
+        "app.services.logging.file.env",
+        lambda k, d=None: {"APP_RUNTIME": "container"}.get(k, d),
+    )
+
+    first = FileLogger(
+        service_name="svc", level="INFO", log_dir=str(tmp_path), sample_rate=1.0
+    )
+    first.info("from first")
+    (old_handler,) = file_mod._listeners["svc_file"].handlers
+    FileLogger(
+        service_name="svc", level="INFO", log_dir=str(tmp_path), sample_rate=1.0
+    )
+
+    # The old writer was drained before its file was closed
+    assert "from first" in (tmp_path / "svc.log").read_text()
+    assert old_handler.stream is None
+    (new_handler,) = file_mod._listeners["svc_file"].handlers
+    assert new_handler is not old_handler
+
+    file_mod._stop_all_listeners()
+    assert new_handler.stream is None
+
+
+def test_file_logger_drops_records_when_queue_is_full(tmp_path, monkeypatch):
+    """A full hand-off queue drops and counts records instead of growing."""
+    from app.services.logging import file as file_mod
+    from app.services.logging.file import FileLogger
+
+    monkeypatch.setattr(
+        "app.services.logging.file.env",
+        lambda k, d=None: {"APP_RUNTIME": "container"}.get(k, d),
+    )
+    monkeypatch.setattr(file_mod, "LOG_QUEUE_MAX_SIZE", 2)
+
+    fl = FileLogger(
+        service_name="svc", level="INFO", log_dir=str(tmp_path), sample_rate=1.0
+    )
+    # Stop the writer so nothing is taken off the queue
+    file_mod._listeners["svc_file"].stop()
+    (queue_handler,) = fl.logger.handlers
+
+    for i in range(5):
+        fl.info(f"message {i}")
+
+    assert queue_handler.queue.qsize() == 2
+    assert queue_handler.dropped == 3
+    for handler in file_mod._listeners.pop("svc_file").handlers:
+        handler.close()
+
+
+def test_file_logger_filtered_level_skips_sampling(tmp_path, monkeypatch):
+    """Calls below the logger level return before sampling."""
+    from app.services.logging.file import FileLogger
+
+    monkeypatch.setattr(
+        "app.services.logging.file.env",
+        lambda k, d=None: {"APP_ENVIRONMENT": "test", "APP_VERSION": "1.2.3"}.get(k, d),
+    )
+
+    fl = FileLogger(
+        service_name="svc", level="ERROR", log_dir=str(tmp_path), sample_rate=0.5
+    )
+
+    def fail_sample():
+        raise AssertionError("sampling should not run for filtered levels")
+
+    monkeypatch.setattr(fl, "_should_sample_log", fail_sample)
+    fl.info("ignored")
+    fl.debug("ignored")
+
+
+def test_file_logger_exception_respects_level(tmp_path, monkeypatch):
+    """exception() is dropped when the logger level is above ERROR."""
+    from app.services.logging.file import FileLogger
+
+    monkeypatch.setattr(
+        "app.services.logging.file.env",
+        lambda k, d=None: {"APP_ENVIRONMENT": "test", "APP_VERSION": "1.2.3"}.get(k, d),
+    )
+
+    fl = FileLogger(service_name="svc", level="CRITICAL", log_dir=str(tmp_path))
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        fl.exception("ignored", user="x")
+
+    log_file = tmp_path / "svc.log"
+    assert not log_file.exists() or log_file.read_text() == ""
+
+
+def test_json_formatter_output_does_not_depend_on_orjson(monkeypatch):
+    """File log lines are compact, unescaped UTF-8 with or without orjson."""
+    import logging
+
+    from app.helpers import serializer
+    from app.services.logging.file import _JsonFormatter
+
+    monkeypatch.setattr(
+        "app.services.logging.file.env",
+        lambda k, d=None: {"APP_ENVIRONMENT": "test", "APP_VERSION": "1.2.3"}.get(k, d),
+    )
+    formatter = _JsonFormatter("svc")
+    record = logging.makeLogRecord(
+        {"msg": "héllo", "levelname": "INFO", "created": 0.0, "user": "zoë"}
+    )
+
+    lines = []
+    for orjson_available in (serializer.ORJSON_AVAILABLE, False):
+        monkeypatch.setattr(serializer, "ORJSON_AVAILABLE", orjson_available)
+        lines.append(formatter.format(record))
+
+    assert lines[0] == lines[1]
+    assert lines[0].startswith(
+        '{"timestamp":"1970-01-01T00:00:00+00:00","level":"INFO",'
+        '"service":"svc","message":"héllo","location":"tests'
+    )
+    assert lines[0].endswith('"environment":"test","version":"1.2.3","user":"zoë"}')
@@ -0,0 +1,30 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from app.helpers import serializer
+from app.helpers.serializer import json_dumps
+
+
+def test_json_dumps_round_trips():
+    data = {"a": 1, "b": [1, 2], "c": "héllo"}
+    assert json.loads(json_dumps(data)) == data
+
+
+def test_json_dumps_uses_default():
+    stamp = datetime(2024, 1, 1, 12, 0, 0)
+    assert json.loads(json_dumps({"t": stamp}, default=str)) == {"t": str(stamp)}
+
+
+def test_json_dumps_without_orjson(monkeypatch):
+    monkeypatch.setattr(serializer, "ORJSON_AVAILABLE", False)
+    assert json_dumps({"a": 1, "b": "héllo"}) == '{"a":1,"b":"héllo"}'
+
+
+@pytest.mark.skipif(not serializer.ORJSON_AVAILABLE, reason="orjson not installed")
+def test_json_dumps_matches_without_orjson(monkeypatch):
+    data = {"a": 1, "b": [1.5, None, True], "c": "héllo", "d": {"e": "€"}}
+    with_orjson = json_dumps(data)
+    monkeypatch.setattr(serializer, "ORJSON_AVAILABLE", False)
+    assert json_dumps(data) == with_orjson
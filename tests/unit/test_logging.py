@@ -1,3 +1,5 @@
+import logging
+
 import pytest
 
 
@@ -14,6 +16,56 @@ def test_logger_factory_stream_and_invalid(monkeypatch):
         LoggerFactory.create_logger("svc", logger_type="nope")
 
 
+def test_logger_factory_reads_sample_rate_per_build(monkeypatch):
+    from app.services.logging import factory as factory_mod
+    from app.services.logging.factory import LoggerFactory
+
+    created = []
+    settings = {}
+
+    class FakeFileLogger:
+        def __init__(self, service_name, level, sample_rate):
+            created.append((service_name, level, sample_rate))
+
+    monkeypatch.setitem(LoggerFactory._lazy_logger_cache, "file", FakeFileLogger)
+    monkeypatch.setattr(factory_mod, "env", lambda k, d=None: settings.get(k, d))
+
+    LoggerFactory.create_logger("a", logger_type="file")
+    settings["LOG_SAMPLE_RATE"] = "0.25"
+    LoggerFactory.create_logger("b", level="DEBUG", logger_type="FILE")
+
+    assert created == [("a", "INFO", 1.0), ("b", "DEBUG", 0.25)]
+
+
+def test_logger_factory_resolves_type_lazily(monkeypatch):
+    from app.services.logging import factory as factory_mod
+    from app.services.logging.factory import LoggerFactory
+
+    lookups = []
+
+    def fake_env(key, default=None):
+        lookups.append(key)
+        return {"LOG_CHANNEL": "Stream"}.get(key, default)
+
+    monkeypatch.setattr(factory_mod, "env", fake_env)
+
+    assert LoggerFactory._resolve_logger_type("FILE") == "file"
+    assert lookups == []
+
+    assert LoggerFactory._resolve_logger_type(None) == "stream"
+    assert lookups == ["LOGGER_TYPE", "LOG_CHANNEL"]
+
+
+def test_logger_factory_imports_logger_class_on_first_use(monkeypatch):
+    from app.services.logging.factory import LoggerFactory
+    from app.services.logging.stream import StreamLogger
+
+    monkeypatch.setattr(LoggerFactory, "_lazy_logger_cache", {})
+
+    assert LoggerFactory._load_logger_class("stream") is StreamLogger
+    assert LoggerFactory._lazy_logger_cache == {"stream": StreamLogger}
+
+
 def test_stream_logger_format_and_fallback(monkeypatch):
     from app.services.logging.stream import StreamLogger
 
@@ -73,6 +125,30 @@ def _test_prettify_extra():
     assert "bob" in pretty
 
 
+def test_prettify_extra_copies_only_when_redacting():
+    from app.services.logging.both import _prettify_extra
+
+    extra = {"password": "s", "name": "bob"}
+    assert _prettify_extra(extra) == (
+        ' | extra: {"password": "[REDACTED]", "name": "bob"}'
+    )
+    # Caller's dict is never modified
+    assert extra == {"password": "s", "name": "bob"}
+
+    # Nothing to redact: the dict is serialised as-is, nested keys included
+    clean = {"name": "bob", "nested": {"token": "t"}}
+    assert _prettify_extra(clean) == (
+        ' | extra: {"name": "bob", "nested": {"token": "t"}}'
+    )
+
+
+def test_prettify_extra_falls_back_to_repr_for_unencodable_values():
+    from app.services.logging.both import _prettify_extra
+
+    marker = object()
+    assert _prettify_extra({"obj": marker}) == f" | extra: {{'obj': {marker!r}}}"
+
+
 def _test_bothlogger_delegation(monkeypatch):
     """Test BothLogger delegates to file and stream loggers."""
     from app.services.logging.both import BothLogger
@@ -121,8 +197,10 @@ def _create_fake_stream_logger(calls):
     """Create fake stream logger class."""
 
     class FakeStream:
-        def __init__(self, *args, **kwargs):
-            pass
+        def __init__(self, *args, level="INFO", **kwargs):
+            # Like StreamLogger, the level is set rather than inherited from root
+            self.logger = logging.getLogger("fake-stream")
+            self.logger.setLevel(level)
 
         def log(self, message, level=None):
             calls["stream"].append(("log", message, level))
@@ -159,3 +237,58 @@ def _assert_delegation_worked(calls):
     assert any(c[0] == "info" for c in calls["file"])
     # Stream logger should have an info call where message includes prettified extra
     assert any(c[0] == "info" and "extra" in c[1] for c in calls["stream"])
+
+
+def test_bothlogger_skips_extra_for_filtered_stream_levels(monkeypatch):
+    import app.services.logging.both as both_mod
+
+    calls = {"file": [], "stream": []}
+    _patch_logger_classes(
+        monkeypatch,
+        _create_fake_file_logger(calls),
+        _create_fake_stream_logger(calls),
+    )
+    b = both_mod.BothLogger(service_name="svc", level="INFO")
+    b.stream_logger.logger.setLevel(logging.INFO)
+
+    def fail_prettify(extra):
+        raise AssertionError("extra should not be rendered for filtered levels")
+
+    monkeypatch.setattr(both_mod, "_prettify_extra", fail_prettify)
+    b.debug("quiet", extra={"password": "x"})
+
+    assert calls["stream"] == []
+    assert [c[0] for c in calls["file"]] == ["debug"]
+
+
+def test_stream_logger_format_message_layout():
+    from app.services.logging.stream import LEVEL_COLORS, RESET, StreamLogger
+
+    s = StreamLogger(service_name="svc", level="INFO")
+
+    formatted = s._format_message("WARNING", "careful", extra={"a": 1})
+    assert formatted.startswith(f"{LEVEL_COLORS['WARNING']}[")
+    assert formatted.endswith(f"] [WARNING] svc:{RESET} careful | extra: {{'a': 1}}")
+
+    # Levels without a color still get the same layout
+    assert s._format_message("TRACE", "x").endswith(f"] [TRACE] svc:{RESET} x")
+
+
+def test_caller_relative_path_skips_logging_and_external_frames():
+    import os
+
+    from app.services.logging.base import caller_relative_path
+
+    root = os.path.abspath("project")
+    handler = os.path.join(root, "handlers", "inference.py")
+
+    assert caller_relative_path(handler, root) == os.path.join(
+        "handlers", "inference.py"
+    )
+    assert (
+        caller_relative_path(
+            os.path.join(root, "app", "services", "logging", "file.py"), root
+        )
+        is None
+    )
+    assert caller_relative_path("/usr/lib/python3.11/logging/__init__.py", root) is None
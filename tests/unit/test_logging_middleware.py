@@ -232,3 +232,24 @@ def test_standard_logger_data_size_calculation(mocker):
     # Size should be greater than 0
     assert input_call[1]["extra"]["input_data_size"] > 0
     assert output_call[1]["extra"]["output_data_size"] > 0
+
+
+def test_standard_logger_reads_debug_settings_once(mocker):
+    """Debug settings are read when wrapping, not on every invocation"""
+    mock_env = mocker.patch("app.middlewares.logging.env", return_value="test")
+
+    wrapped_handler = standard_logger(Mock(return_value={}), logger=Mock())
+    calls = mock_env.call_count
+
+    wrapped_handler(MockEvent(), MockContext())
+    wrapped_handler(MockEvent(), MockContext())
+
+    assert mock_env.call_count == calls
+
+
+def test_data_size_matches_utf8_length():
+    """ASCII fast path and multi-byte text both report UTF-8 byte size"""
+    from app.middlewares.logging import _data_size
+
+    assert _data_size({"data": "x" * 10}) == len(str({"data": "x" * 10}))
+    assert _data_size("héllo") == len("héllo".encode("utf-8"))
@@ -3,9 +3,19 @@ from types import SimpleNamespace
 
 import pytest
 
+from app.helpers import secret as secret_mod
 from app.helpers.secret import Secret
 
 
+@pytest.fixture(autouse=True)
+def clear_secret_cache():
+    Secret.clear_cache()
+    secret_mod.get_secrets_manager_client.cache_clear()
+    yield
+    Secret.clear_cache()
+    secret_mod.get_secrets_manager_client.cache_clear()
+
+
 def test_secret_without_id_defaults():
     s = Secret()
     # no data loaded, should return default when using call
@@ -47,3 +57,186 @@ def test_secret_load_exception(mocker):
     assert s("any", "def") == "def"
     with pytest.raises(AttributeError):
         _ = s.username
+
+
+def test_secret_load_reuses_cached_value(mocker):
+    calls = []
+
+    def get_secret_value(SecretId):
+        calls.append(SecretId)
+        return {"SecretString": json.dumps({"username": "admin"})}
+
+    mocker.patch(
+        "boto3.client", return_value=SimpleNamespace(get_secret_value=get_secret_value)
+    )
+
+    assert Secret("cached-id").username == "admin"
+    assert Secret("cached-id").username == "admin"
+    assert calls == ["cached-id"]
+
+
+def test_secret_cache_expires_and_evicts(mocker, monkeypatch):
+    calls = []
+
+    def get_secret_value(SecretId):
+        calls.append(SecretId)
+        return {"SecretString": json.dumps({"id": SecretId})}
+
+    mocker.patch(
+        "boto3.client", return_value=SimpleNamespace(get_secret_value=get_secret_value)
+    )
+    now = [1000.0]
+    monkeypatch.setattr(secret_mod.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(secret_mod, "SECRET_CACHE_MAX_SIZE", 2)
+
+    Secret("a")
+    Secret("b")
+    Secret("c")  # evicts "a"
+    Secret("b")
+    assert calls == ["a", "b", "c"]
+
+    Secret("a")
+    assert calls == ["a", "b", "c", "a"]
+
+    now[0] += secret_mod.SECRET_CACHE_TTL_SECONDS
+    Secret("a")
+    assert calls == ["a", "b", "c", "a", "a"]
+
+
+def test_secret_load_failure_is_not_cached(mocker):
+    class BadClient:
+        def get_secret_value(self, SecretId):
+            raise Exception("nope")
+
+    mocker.patch("boto3.client", return_value=BadClient())
+    Secret("flaky-id")
+
+    good = SimpleNamespace(
+        get_secret_value=lambda SecretId: {"SecretString": json.dumps({"k": "v"})}
+    )
+    mocker.patch("boto3.client", return_value=good)
+    secret_mod.get_secrets_manager_client.cache_clear()
+    assert Secret("flaky-id").k == "v"
+
+
+def test_secret_client_is_shared_across_loads(mocker):
+    payload = {"SecretString": json.dumps({"k": "v"})}
+    client_factory = mocker.patch(
+        "boto3.client",
+        return_value=SimpleNamespace(get_secret_value=lambda SecretId: payload),
+    )
+
+    Secret("first")
+    Secret("second")
+
+    client_factory.assert_called_once_with("secretsmanager")
+
+
+def test_secret_load_many_batches_cache_misses(mocker):
+    batches = []
+
+    def batch_get_secret_value(SecretIdList):
+        batches.append(list(SecretIdList))
+        return {
+            "SecretValues": [
+                {
+                    "ARN": f"arn:{name}",
+                    "Name": name,
+                    "SecretString": json.dumps({"name": name}),
+                }
+                for name in SecretIdList
+                if name != "missing"
+            ],
+            "Errors": [{"SecretId": "missing", "ErrorCode": "ResourceNotFound"}],
+        }
+
+    def get_secret_value(SecretId):
+        raise Exception("not found")
+
+    mocker.patch(
+        "boto3.client",
+        return_value=SimpleNamespace(
+            batch_get_secret_value=batch_get_secret_value,
+            get_secret_value=get_secret_value,
+        ),
+    )
+
+    Secret.load_many(["a"])
+    secrets = Secret.load_many(["a", "b", "missing", "b"])
+
+    assert batches == [["a"], ["b", "missing"]]
+    assert list(secrets) == ["a", "b", "missing"]
+    assert secrets["a"].name == "a"
+    assert secrets["b"]("name") == "b"
+    assert secrets["missing"]("name", "default") == "default"
+
+
+def test_secret_cache_drops_expired_entries_before_live_ones(mocker, monkeypatch):
+    calls = []
+
+    def get_secret_value(SecretId):
+        calls.append(SecretId)
+        return {"SecretString": json.dumps({"id": SecretId})}
+
+    mocker.patch(
+        "boto3.client", return_value=SimpleNamespace(get_secret_value=get_secret_value)
+    )
+    now = [0.0]
+    monkeypatch.setattr(secret_mod.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(secret_mod, "SECRET_CACHE_TTL_SECONDS", 300.0)
+    monkeypatch.setattr(secret_mod, "SECRET_CACHE_MAX_SIZE", 2)
+
+    Secret("b")
+    now[0] = 100.0
+    Secret("a")
+    now[0] = 250.0
+    Secret("b")  # hit; "a" is now least recently used
+    now[0] = 350.0
+    Secret("c")  # "b" has expired and is swept instead of evicting "a"
+    Secret("a")
+
+    assert calls == ["b", "a", "c"]
+    assert list(Secret._cache) == ["c", "a"]
+
+
+def test_secret_purge_expired(mocker, monkeypatch):
+    mocker.patch(
+        "boto3.client",
+        return_value=SimpleNamespace(
+            get_secret_value=lambda SecretId: {"SecretString": json.dumps({})}
+        ),
+    )
+    now = [0.0]
+    monkeypatch.setattr(secret_mod.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(secret_mod, "SECRET_CACHE_TTL_SECONDS", 300.0)
+
+    Secret("old")
+    now[0] = 200.0
+    Secret("new")
+
+    assert Secret.purge_expired() == 0
+    now[0] = 300.0
+    assert Secret.purge_expired() == 1
+    assert list(Secret._cache) == ["new"]
+    assert Secret._expiry_heap == [(500.0, "new")]
+
+
+def test_secret_invalidate_refetches_only_that_secret(mocker):
+    calls = []
+
+    def get_secret_value(SecretId):
+        calls.append(SecretId)
+        return {"SecretString": json.dumps({"id": SecretId})}
+
+    mocker.patch(
+        "boto3.client", return_value=SimpleNamespace(get_secret_value=get_secret_value)
+    )
+
+    Secret("rotated")
+    Secret("stable")
+    Secret.invalidate("rotated")
+    Secret.invalidate("never-loaded")
+    Secret("rotated")
+    Secret("stable")
+
+    assert calls == ["rotated", "stable", "rotated"]
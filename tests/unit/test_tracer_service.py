@@ -127,3 +127,51 @@ def _test_capture_decorators():
 
     cm = capture_method(C.m)
     assert callable(cm)
+
+
+def test_validate_service_name_strips_only_padded_names():
+    from app.services.tracing.factory import validate_service_name
+
+    assert validate_service_name("svc") == "svc"
+    assert validate_service_name("  svc ") == "svc"
+    with pytest.raises(ValueError):
+        validate_service_name("   ")
+    with pytest.raises(ValueError):
+        validate_service_name("")
+
+
+@pytest.mark.parametrize("tracer_type", ["local", None])
+def test_local_tracer_does_not_import_cloud_tracing(monkeypatch, tracer_type):
+    for name in list(sys.modules):
+        if name == "app.services.tracing.cloud" or name.startswith("aws_xray_sdk"):
+            monkeypatch.delitem(sys.modules, name)
+    monkeypatch.setattr(
+        "app.services.tracing.factory.env",
+        lambda k, d=None: {"APP_ENVIRONMENT": "local"}.get(k, d),
+    )
+
+    tracer = TracerFactory.create_tracer(service_name="svc", tracer_type=tracer_type)
+
+    assert isinstance(tracer, LocalTracer)
+    assert "app.services.tracing.cloud" not in sys.modules
+    assert not any(name.startswith("aws_xray_sdk") for name in sys.modules)
+
+
+@pytest.mark.parametrize("tracer_type", ["cloud", "AWS", "xray", None])
+def test_cloud_tracer_types_build_cloud_tracer(monkeypatch, tracer_type):
+    built = []
+
+    class FakeCloudTracer:
+        def __init__(self, service_name):
+            built.append(service_name)
+
+    monkeypatch.setattr("app.services.tracing.cloud.CloudTracer", FakeCloudTracer)
+    monkeypatch.setattr(
+        "app.services.tracing.factory.env",
+        lambda k, d=None: {"APP_ENVIRONMENT": "prod"}.get(k, d),
+    )
+
+    tracer = TracerFactory.create_tracer(service_name="svc", tracer_type=tracer_type)
+
+    assert isinstance(tracer, FakeCloudTracer)
+    assert built == ["svc"]
@@ -1,5 +1,6 @@
 import json
 import tempfile
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import mock_open, patch
 
@@ -38,6 +39,20 @@ def test_write_trace(tracer):
     assert entry["metadata"] == {"foo": "bar"}
 
 
+def test_write_trace_exact_line(tracer, monkeypatch):
+    class FixedDatetime:
+        @staticmethod
+        def now():
+            return datetime(2024, 1, 2, 3, 4, 5)
+
+    monkeypatch.setattr("app.services.tracing.local.datetime", FixedDatetime)
+    tracer._write_trace("seg", {"name": "héllo"})
+    assert tracer.trace_file.read_text() == (
+        '{"timestamp":"2024-01-02 03:04:05","service":"test_service",'
+        '"segment":"seg","metadata":{"name":"héllo"}}\n'
+    )
+
+
 def test_capture_lambda_handler_success(tracer):
     def handler(event, context):
         return "ok"
@@ -96,7 +111,7 @@ def test_create_segment_success(tracer):
         pass
     with open(tracer.trace_file) as f:
         lines = f.readlines()
-    assert any('"segment": "seg"' in line for line in lines)
+    assert any('"segment":"seg"' in line for line in lines)
     assert any('"processing_time"' in line for line in lines)
 
 
@@ -108,5 +123,5 @@ def test_create_segment_error(tracer):
         pass
     with open(tracer.trace_file) as f:
         lines = f.readlines()
-    assert any('"segment": "segerr_error"' in line for line in lines)
+    assert any('"segment":"segerr_error"' in line for line in lines)
     assert any('"processing_time"' in line for line in lines)
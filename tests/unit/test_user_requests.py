@@ -51,3 +51,26 @@ def test_user_update_invalid_username():
 def test_user_update_invalid_email():
     with pytest.raises(ValidationError):
         UserUpdateRequest(email="")
+
+
+def test_user_username_is_stripped():
+    req = UserCreateRequest(username="  alice  ", email="a@b.com", password=" pw ")
+    assert req.username == "alice"
+    assert req.password == " pw "
+    with pytest.raises(ValidationError):
+        UserUpdateRequest(username="  ab  ")
+
+
+@pytest.mark.parametrize(
+    "model, kwargs, field",
+    [
+        (UserCreateRequest, {"username": "ab", "email": "a@b.com"}, "username"),
+        (UserCreateRequest, {"username": "alice", "email": " "}, "email"),
+        (UserUpdateRequest, {"username": "x" * 21}, "username"),
+        (UserUpdateRequest, {"email": ""}, "email"),
+    ],
+)
+def test_user_request_errors_keep_field_location(model, kwargs, field):
+    with pytest.raises(ValidationError) as exc:
+        model(password="pw", **kwargs)
+    assert [error["loc"] for error in exc.value.errors()] == [(field,)]
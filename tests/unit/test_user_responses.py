@@ -1,3 +1,9 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
 from app.responses.user import (
     PaginatedUserResponse,
     Pagination,
@@ -25,6 +31,16 @@ def test_user_response_id_conversion():
     assert ur2.id == "abc"
 
 
+def test_user_response_id_accepts_any_type():
+    user_id = uuid.UUID("12345678-1234-5678-1234-567812345678")
+    ur = UserResponse(id=user_id, username="u", email="e")
+    assert ur.id == str(user_id)
+    ur2 = UserResponse.model_validate(
+        SimpleNamespace(id=user_id, username="u", email="e", profile=None)
+    )
+    assert ur2.id == str(user_id)
+
+
 def test_single_user_response():
     ur = UserResponse(id=1, username="u", email="e")
     resp = SingleUserResponse(data=ur, status_code=200)
@@ -61,3 +77,17 @@ def test_user_create_update_response():
     assert ur.id == 2
     assert ur.username == "u2"
     assert ur.email == "e2"
+
+
+def test_user_response_from_model():
+    user = SimpleNamespace(id=7, username="u", email="e")
+    ur = UserResponse.from_model(user)
+    assert ur.id == "7"
+    assert ur.username == "u"
+    assert ur.profile is None
+
+
+def test_responses_are_frozen():
+    ur = UserResponse(id=1, username="u", email="e")
+    with pytest.raises(ValidationError):
+        ur.username = "other"